@@ -7,14 +7,22 @@ of new matches to a Discord channel via a webhook.
 Designed to be run daily, e.g., from PythonAnywhere scheduled tasks.
 """
 
+import bisect
+import functools
 import json
 import logging
+import math
 import os
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
 from time import sleep
-from typing import Dict, Iterable, List
+from typing import Dict, List
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import quote_plus
 
 
@@ -35,15 +43,30 @@ DISCORD_WEBHOOK_URL = (
     else "https://discordapp.com/api/webhooks/REPLACE_ME"
 )
 
-# Local JSON file to persist which project IDs have already been processed.
+# SQLite database holding processed project IDs and last-update markers.
+PROCESSED_IDS_DB = "processed_ids.db"
+
+# Legacy JSON state file; imported into SQLite once if still present.
 PROCESSED_IDS_FILE = "processed_ids.json"
 
 # Local JSON file to track monitor state (e.g. last heartbeat date).
 STATE_FILE = "monitor_state.json"
 
+# Local JSON cache of Projects API pages plus their HTTP validators
+# (ETag / Last-Modified), so unchanged pages can be answered with a
+# body-less 304 on the next run.
+PROJECTS_CACHE_FILE = "projects_cache.json"
+
 # World Bank Projects API endpoint.
 WB_PROJECTS_API_URL = "https://search.worldbank.org/api/v2/projects"
 
+# Only the fields this script actually consumes; requesting them via the
+# API's `fl` parameter keeps the JSON payloads small.
+WB_PROJECTS_FIELDS = (
+    "id,project_name,project_abstract,countrycode,url,"
+    "boardapprovaldate,totalamt,totalcommamt,p2a_updated_date"
+)
+
 # Keywords to search for in project titles and descriptions.
 # These are intentionally broad to catch most GIS / spatial / environmental
 # analytics work across sectors (land, environment, climate, health, etc.).
@@ -146,6 +169,15 @@ KEYWORDS = [
     "Service Coverage Mapping",
 ]
 
+# Single compiled alternation over KEYWORDS so each project text is
+# scanned once, instead of one substring pass per keyword. Longest-first
+# ordering keeps the alternation deterministic; IGNORECASE replaces the
+# per-call lower() copies.
+_KEYWORD_RE = re.compile(
+    "|".join(sorted({re.escape(k) for k in KEYWORDS}, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
 # Extra terms to enrich the contractor Google search so that the
 # results are more likely to be GIS / geospatial / environmental / health
 # analytics implementers and consulting firms.
@@ -190,35 +222,62 @@ CONTRACTOR_SEARCH_TERMS = [
 ]
 
 
-def load_monitor_state(path: str = STATE_FILE) -> Dict[str, str]:
-    """Load monitor state (e.g. last heartbeat date) from disk.
+def _atomic_json_dump(obj: Dict[str, str], path: str, label: str) -> None:
+    """Write JSON compactly to a temp file and rename it into place.
 
-    Returns an empty dict on first run or on any read/parse error.
+    The rename is atomic on POSIX, so a crash mid-write cannot leave a
+    truncated state file behind.
     """
 
-    if not os.path.exists(path):
-        return {}
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        LOGGER.error("Failed to save %s to %s: %s", label, path, exc)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_json_state_cached(path: str, mtime: float) -> Dict[str, str]:
+    """Parse a JSON state file, cached on (path, mtime).
+
+    Keying on mtime makes stale entries impossible: any writer bumps the
+    file's mtime, which changes the cache key.
+    """
 
     try:
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
-        if isinstance(data, dict):
-            # Ensure keys/values are strings for simplicity.
-            return {str(k): str(v) for k, v in data.items()}
     except (OSError, json.JSONDecodeError):
         return {}
 
+    if isinstance(data, dict):
+        # Ensure keys/values are strings for simplicity.
+        return {str(k): str(v) for k, v in data.items()}
+
     return {}
 
 
+def load_monitor_state(path: str = STATE_FILE) -> Dict[str, str]:
+    """Load monitor state (e.g. last heartbeat date) from disk.
+
+    Returns an empty dict on first run or on any read/parse error. Parsed
+    results are reused within the process until the file changes on disk;
+    a copy is returned so callers can mutate freely.
+    """
+
+    if not os.path.exists(path):
+        return {}
+
+    return dict(_load_json_state_cached(path, os.path.getmtime(path)))
+
+
 def save_monitor_state(state: Dict[str, str], path: str = STATE_FILE) -> None:
-    """Persist monitor state to disk."""
+    """Persist monitor state to disk atomically."""
 
-    try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
-    except OSError as exc:
-        LOGGER.error("Failed to save monitor state: %s", exc)
+    _atomic_json_dump(state, path, "monitor state")
+    _load_json_state_cached.cache_clear()
 
 # HTTP timeout (seconds) for all outbound requests.
 HTTP_TIMEOUT = 15
@@ -227,6 +286,51 @@ HTTP_TIMEOUT = 15
 MAX_RETRIES = 3
 RETRY_BACKOFF_SECONDS = 3
 
+# Retry policy shared by all HTTP calls. urllib3 handles exponential
+# backoff, retries transient 5xx errors, and honours Discord's
+# Retry-After header on 429 responses. Retrying POSTs means a webhook
+# whose response was lost can be delivered twice; for an alerting bot a
+# rare duplicate beats a silently dropped alert.
+_RETRY = Retry(
+    total=MAX_RETRIES,
+    backoff_factor=RETRY_BACKOFF_SECONDS,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+    respect_retry_after_header=True,
+)
+
+# Shared HTTP session so keep-alive connections are reused across the
+# World Bank pagination loop and the per-project Discord posts, instead
+# of paying a fresh TCP + TLS handshake on every request.
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {
+        "User-Agent": "WB-GIS-Monitor/1.0",
+        # Ask for compressed responses explicitly; the verbose WB JSON
+        # shrinks several-fold on the wire and requests decompresses it
+        # transparently.
+        "Accept-Encoding": "gzip, deflate",
+    }
+)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY),
+)
+
+# Parallel workers for Discord webhook posts, plus per-worker pacing so
+# the combined rate stays under Discord's ~5 requests/second webhook
+# budget (4 workers x 1 message / 1.25s is at most 48 messages/minute).
+DISCORD_MAX_WORKERS = 4
+DISCORD_SEND_INTERVAL_SECONDS = 1.25
+
+# Discord allows up to 10 embeds per webhook message; batching to that
+# limit turns N notification posts into ceil(N / 10).
+DISCORD_MAX_EMBEDS_PER_MESSAGE = 10
+
+# Parallel workers for prefetching World Bank Projects API pages once the
+# total result count is known from page 1.
+WB_PAGE_FETCH_WORKERS = 8
+
 
 def get_with_retries(
     url: str,
@@ -234,45 +338,22 @@ def get_with_retries(
     params: Dict | None = None,
     headers: Dict | None = None,
     timeout: int = HTTP_TIMEOUT,
-    max_retries: int = MAX_RETRIES,
 ) -> requests.Response | None:
-    """Perform a GET request with basic retry logic.
+    """Perform a GET request, retrying via the session's Retry policy.
 
-    Returns the last successful ``requests.Response`` or ``None`` if all
-    attempts fail.
+    Returns the ``requests.Response`` or ``None`` if all attempts fail.
     """
 
-    attempt = 1
-    while attempt <= max_retries:
-        try:
-            response = requests.get(
-                url,
-                params=params,
-                headers=headers,
-                timeout=timeout,
-            )
-            return response
-        except requests.RequestException as exc:
-            if attempt == max_retries:
-                LOGGER.error(
-                    "GET %s failed after %d attempts: %s",
-                    url,
-                    attempt,
-                    exc,
-                )
-                return None
-
-            LOGGER.warning(
-                "GET %s failed on attempt %d/%d: %s; retrying...",
-                url,
-                attempt,
-                max_retries,
-                exc,
-            )
-            sleep(RETRY_BACKOFF_SECONDS * attempt)
-            attempt += 1
-
-    return None
+    try:
+        return _SESSION.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+        )
+    except requests.RequestException as exc:
+        LOGGER.error("GET %s failed after retries: %s", url, exc)
+        return None
 
 
 def post_with_retries(
@@ -281,41 +362,19 @@ def post_with_retries(
     payload: Dict,
     headers: Dict | None = None,
     timeout: int = HTTP_TIMEOUT,
-    max_retries: int = MAX_RETRIES,
 ) -> requests.Response | None:
-    """Perform a POST request with basic retry logic."""
-
-    attempt = 1
-    while attempt <= max_retries:
-        try:
-            response = requests.post(
-                url,
-                json=payload,
-                headers=headers,
-                timeout=timeout,
-            )
-            return response
-        except requests.RequestException as exc:
-            if attempt == max_retries:
-                LOGGER.error(
-                    "POST %s failed after %d attempts: %s",
-                    url,
-                    attempt,
-                    exc,
-                )
-                return None
-
-            LOGGER.warning(
-                "POST %s failed on attempt %d/%d: %s; retrying...",
-                url,
-                attempt,
-                max_retries,
-                exc,
-            )
-            sleep(RETRY_BACKOFF_SECONDS * attempt)
-            attempt += 1
+    """Perform a POST request, retrying via the session's Retry policy."""
 
-    return None
+    try:
+        return _SESSION.post(
+            url,
+            json=payload,
+            headers=headers,
+            timeout=timeout,
+        )
+    except requests.RequestException as exc:
+        LOGGER.error("POST %s failed after retries: %s", url, exc)
+        return None
 
 
 # ---------------------------------------------------------------------------
@@ -323,43 +382,111 @@ def post_with_retries(
 # ---------------------------------------------------------------------------
 
 
-def load_processed_projects(path: str = PROCESSED_IDS_FILE) -> Dict[str, str]:
-    """Load processed projects from disk.
+class ProcessedProjects:
+    """Dict-like view over the processed-projects SQLite table.
+
+    Lookups go straight to the indexed primary key, so startup cost no
+    longer grows with the number of projects ever seen. Assignments are
+    buffered and written back in a single transaction by ``flush()``.
+    """
+
+    def __init__(self, path: str = PROCESSED_IDS_DB) -> None:
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS processed ("
+            "project_id TEXT PRIMARY KEY, last_update TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        self._pending: Dict[str, str] = {}
+
+    def get(self, project_id: str) -> str | None:
+        """Return the stored last-update marker, or None if unseen."""
+
+        if project_id in self._pending:
+            return self._pending[project_id]
+        row = self._conn.execute(
+            "SELECT last_update FROM processed WHERE project_id = ?",
+            (project_id,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def __setitem__(self, project_id: str, last_update: str) -> None:
+        self._pending[project_id] = last_update
+
+    def __len__(self) -> int:
+        (count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM processed"
+        ).fetchone()
+        return count
+
+    def flush(self) -> int:
+        """Write buffered changes in one transaction; returns rows written."""
+
+        if not self._pending:
+            return 0
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO processed (project_id, last_update)"
+                " VALUES (?, ?)",
+                list(self._pending.items()),
+            )
+        written = len(self._pending)
+        self._pending.clear()
+        return written
+
+
+def _migrate_legacy_processed_file(
+    store: ProcessedProjects, path: str = PROCESSED_IDS_FILE
+) -> None:
+    """One-time import of the old processed_ids.json into SQLite.
 
-    The modern format is a mapping of ``project_id -> last_update_string``.
-    For backward compatibility, if the file contains a simple list of
-    project IDs, they are loaded with an empty last-update value.
+    Handles both the modern ``id -> last_update`` mapping and the legacy
+    list-of-IDs format, then renames the JSON file out of the way so it
+    is not re-imported over fresher database rows on the next run.
     """
 
     if not os.path.exists(path):
-        return {}
+        return
 
     try:
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
     except (OSError, json.JSONDecodeError):
-        return {}
+        return
 
     if isinstance(data, dict):
-        return {str(k): str(v) for k, v in data.items()}
+        legacy = {str(k): str(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        legacy = {str(item): "" for item in data}
+    else:
+        legacy = {}
 
-    if isinstance(data, list):
-        # Legacy format: list of IDs only.
-        return {str(item): "" for item in data}
+    for project_id, last_update in legacy.items():
+        store[project_id] = last_update
+    store.flush()
 
-    return {}
+    try:
+        os.replace(path, path + ".migrated")
+    except OSError as exc:
+        LOGGER.error("Failed to rename legacy state file %s: %s", path, exc)
 
+    LOGGER.info("Migrated %d legacy entries from %s.", len(legacy), path)
 
-def save_processed_projects(
-    projects: Dict[str, str], path: str = PROCESSED_IDS_FILE
-) -> None:
-    """Persist processed project IDs and last-update markers to disk."""
 
-    try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(projects, f, indent=2)
-    except OSError as exc:
-        LOGGER.error("Failed to save processed projects: %s", exc)
+def load_processed_projects(db_path: str = PROCESSED_IDS_DB) -> ProcessedProjects:
+    """Open the processed-projects store, importing legacy JSON if present."""
+
+    store = ProcessedProjects(db_path)
+    _migrate_legacy_processed_file(store)
+    return store
+
+
+def save_processed_projects(projects: ProcessedProjects) -> int:
+    """Persist buffered processed-project changes; returns rows written."""
+
+    return projects.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -367,81 +494,234 @@ def save_processed_projects(
 # ---------------------------------------------------------------------------
 
 
-def fetch_active_projects_for_nigeria(rows_per_page: int = 50) -> List[Dict]:
+def _load_projects_cache(path: str = PROJECTS_CACHE_FILE) -> Dict:
+    """Load cached Projects API pages and their HTTP validators."""
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        data = {}
+
+    if not isinstance(data, dict):
+        data = {}
+
+    return {
+        "validators": data.get("validators") or {},
+        "pages": data.get("pages") or {},
+    }
+
+
+def _save_projects_cache(cache: Dict, path: str = PROJECTS_CACHE_FILE) -> None:
+    """Persist the Projects API page cache atomically."""
+
+    _atomic_json_dump(cache, path, "projects cache")
+
+
+def _fetch_projects_page(
+    page: int, rows_per_page: int, cache: Dict
+) -> tuple[Dict | None, bool]:
+    """Fetch and decode one page of the World Bank Projects API.
+
+    Sends the cached ETag / Last-Modified validators as a conditional
+    request; a 304 answer reuses the cached payload without transferring
+    or parsing a body. Returns (payload, cache_changed), with payload
+    None on any HTTP or parse error.
+    """
+
+    params = {
+        "format": "json",
+        "status": "Active",
+        # Server-side country hint; the client-side NG filter stays as a
+        # backup because the API does not always honour it.
+        "countrycode_exact": "NG",
+        "fl": WB_PROJECTS_FIELDS,
+        "rows": rows_per_page,
+        "page": page,
+    }
+
+    page_key = str(page)
+    validators = cache["validators"].get(page_key) or {}
+    headers: Dict | None = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    if not headers:
+        headers = None
+
+    response = get_with_retries(
+        WB_PROJECTS_API_URL,
+        params=params,
+        headers=headers,
+    )
+    if response is None:
+        LOGGER.error("Failed to fetch page %d from World Bank API.", page)
+        return None, False
+
+    if response.status_code == 304:
+        cached_payload = cache["pages"].get(page_key)
+        if cached_payload is not None:
+            LOGGER.info("Page %d unchanged (304); using cached payload.", page)
+            return cached_payload, False
+        # Validator matched but the cached body is gone; refetch fully.
+        response = get_with_retries(WB_PROJECTS_API_URL, params=params)
+        if response is None:
+            LOGGER.error("Failed to re-fetch page %d from World Bank API.", page)
+            return None, False
+
+    try:
+        response.raise_for_status()
+    except requests.RequestException as exc:
+        LOGGER.error(
+            "World Bank API responded with error on page %d: %s",
+            page,
+            exc,
+        )
+        return None, False
+
+    try:
+        # Decode the raw bytes directly; this skips requests' charset
+        # detection pass on multi-hundred-KB payloads.
+        payload = json.loads(response.content)
+    except json.JSONDecodeError as exc:
+        LOGGER.error("Failed to parse JSON from World Bank API: %s", exc)
+        return None, False
+
+    new_validators = {}
+    etag = response.headers.get("ETag")
+    if etag:
+        new_validators["etag"] = etag
+    last_modified = response.headers.get("Last-Modified")
+    if last_modified:
+        new_validators["last_modified"] = last_modified
+
+    if new_validators:
+        cache["validators"][page_key] = new_validators
+        cache["pages"][page_key] = payload
+        return payload, True
+
+    return payload, False
+
+
+def _extract_nigeria_projects(payload: Dict) -> List[Dict]:
+    """Filter a page payload down to projects that include Nigeria (NG)."""
+
+    projects_dict = payload.get("projects") or {}
+    if not isinstance(projects_dict, dict):
+        LOGGER.warning("Unexpected 'projects' format from API.")
+        return []
+
+    nigeria_projects: List[Dict] = []
+    for project in projects_dict.values():
+        country_codes = project.get("countrycode") or []
+        if not isinstance(country_codes, list):
+            continue
+        if "NG" in country_codes:
+            nigeria_projects.append(project)
+
+    return nigeria_projects
+
+
+# String fields coerced by _normalize_project; missing or non-string
+# values become "".
+_PROJECT_STR_FIELDS = (
+    "project_name",
+    "url",
+    "boardapprovaldate",
+    "p2a_updated_date",
+    "totalamt",
+    "totalcommamt",
+)
+
+
+def _normalize_project(project: Dict) -> Dict:
+    """Coerce a raw API project record into a uniform shape, in place.
+
+    Downstream helpers can then read fields directly instead of
+    re-running isinstance checks on every access: the fields in
+    _PROJECT_STR_FIELDS are guaranteed str (empty when absent),
+    `countrycode` is a list, and the abstract is flattened into a single
+    `_abstract_text` string.
+    """
+
+    for key in _PROJECT_STR_FIELDS:
+        value = project.get(key)
+        project[key] = value if isinstance(value, str) else ""
+
+    codes = project.get("countrycode")
+    project["countrycode"] = codes if isinstance(codes, list) else []
+
+    abstract = project.get("project_abstract")
+    if isinstance(abstract, dict):
+        project["_abstract_text"] = " \n".join(
+            value for value in abstract.values() if isinstance(value, str)
+        )
+    else:
+        project["_abstract_text"] = ""
+
+    return project
+
+
+def fetch_active_projects_for_nigeria(rows_per_page: int = 500) -> List[Dict]:
     """Fetch all active World Bank projects for Nigeria (NG).
 
+    With the server-side country filter, Nigeria's active portfolio fits
+    in a single 500-row page in practice, so pagination usually stops
+    after one request. Should the result ever spill over, page 1 still
+    reveals the total count and the remaining pages are prefetched in
+    parallel over the shared session.
+
     The World Bank search API does not always filter perfectly by country
     via query parameters, so this function additionally filters by
     `countrycode` on the client side.
     """
 
-    all_projects: List[Dict] = []
-    page = 1
+    cache = _load_projects_cache()
 
-    while True:
-        params = {
-            "format": "json",
-            "status": "Active",
-            "rows": rows_per_page,
-            "page": page,
-        }
+    payload, cache_dirty = _fetch_projects_page(1, rows_per_page, cache)
+    if payload is None:
+        return []
 
-        response = get_with_retries(
-            WB_PROJECTS_API_URL,
-            params=params,
-            headers={"User-Agent": "WB-GIS-Monitor/1.0"},
-        )
-        if response is None:
-            LOGGER.error("Failed to fetch page %d from World Bank API.", page)
-            break
-
-        try:
-            response.raise_for_status()
-        except requests.RequestException as exc:
-            LOGGER.error(
-                "World Bank API responded with error on page %d: %s",
-                page,
-                exc,
-            )
-            break
-
-        try:
-            payload = response.json()
-        except json.JSONDecodeError as exc:
-            LOGGER.error("Failed to parse JSON from World Bank API: %s", exc)
-            break
-
-        # Basic pagination info.
-        total = int(payload.get("total", 0))
-        rows = int(payload.get("rows", rows_per_page))
-
-        projects_dict = payload.get("projects") or {}
-        if not isinstance(projects_dict, dict):
-            LOGGER.warning("Unexpected 'projects' format from API.")
-            break
-
-        # Filter to projects where Nigeria (NG) is in the country code list.
-        for project in projects_dict.values():
-            country_codes = project.get("countrycode") or []
-            if not isinstance(country_codes, list):
-                continue
-            if "NG" in country_codes:
-                all_projects.append(project)
+    all_projects = _extract_nigeria_projects(payload)
 
-        LOGGER.info(
-            "Retrieved page %d: %d projects (total=%d).",
-            page,
-            len(projects_dict),
-            total,
-        )
+    total = int(payload.get("total", 0))
+    rows = int(payload.get("rows", rows_per_page)) or rows_per_page
+    num_pages = math.ceil(total / rows) if total else 1
 
-        # Stop when we've fetched all known results.
-        if page * rows >= total or not projects_dict:
-            break
+    LOGGER.info(
+        "Retrieved page 1 of %d (total=%d projects).",
+        num_pages,
+        total,
+    )
+
+    if num_pages > 1:
+        with ThreadPoolExecutor(max_workers=WB_PAGE_FETCH_WORKERS) as executor:
+            page_payloads = executor.map(
+                lambda page: _fetch_projects_page(page, rows_per_page, cache),
+                range(2, num_pages + 1),
+            )
+            for page_payload, page_dirty in page_payloads:
+                cache_dirty = cache_dirty or page_dirty
+                if page_payload is not None:
+                    all_projects.extend(_extract_nigeria_projects(page_payload))
+
+    # Drop cached pages beyond the current page count (or with mangled
+    # keys) so the cache file does not accumulate stale tails as the
+    # result set shrinks.
+    for mapping in (cache["validators"], cache["pages"]):
+        stale_keys = [
+            k for k in mapping if not k.isdigit() or int(k) > num_pages
+        ]
+        for page_key in stale_keys:
+            del mapping[page_key]
+            cache_dirty = True
 
-        page += 1
+    if cache_dirty:
+        _save_projects_cache(cache)
 
-    return all_projects
+    # Normalize after the cache save so the cached payloads stay raw.
+    return [_normalize_project(project) for project in all_projects]
 
 
 # ---------------------------------------------------------------------------
@@ -450,46 +730,55 @@ def fetch_active_projects_for_nigeria(rows_per_page: int = 50) -> List[Dict]:
 
 
 def extract_project_text(project: Dict) -> str:
-    """Concatenate title and description-ish fields into a single text blob."""
-
-    parts: List[str] = []
+    """Concatenate title and abstract into a single text blob.
 
-    title = project.get("project_name") or ""
-    if isinstance(title, str):
-        parts.append(title)
-
-    # The API often has a nested `project_abstract` with a `cdata` field.
-    abstract = project.get("project_abstract")
-    if isinstance(abstract, dict):
-        for value in abstract.values():
-            if isinstance(value, str):
-                parts.append(value)
+    Assumes the project has been through _normalize_project, which
+    flattens the abstract into `_abstract_text`.
+    """
 
-    return " \n".join(parts)
+    title = project["project_name"]
+    abstract_text = project["_abstract_text"]
+    if title and abstract_text:
+        return title + " \n" + abstract_text
+    return title or abstract_text
 
 
-def project_matches_keywords(project: Dict, keywords: Iterable[str]) -> bool:
-    """Return True if any keyword appears in the project's text.
+def filter_matching_projects(projects: List[Dict]) -> List[Dict]:
+    """Return the projects whose text contains any GIS keyword.
 
-    The check is case-insensitive and searches both title and description.
+    All project texts are joined with a record separator and scanned in a
+    single pass of the keyword regex; match offsets are mapped back to
+    project indices with bisect. The whole corpus scan therefore stays
+    inside the C regex engine instead of doing one Python-level search
+    per project.
     """
 
-    text = extract_project_text(project)
-    if not text:
-        return False
-
-    lower_text = text.lower()
-    for kw in keywords:
-        if kw.lower() in lower_text:
-            return True
-    return False
+    if not projects:
+        return []
+
+    texts = [extract_project_text(project) for project in projects]
+    # "\x1e" (ASCII record separator) cannot appear in any keyword, so a
+    # match can never span two projects.
+    blob = "\x1e".join(texts)
+
+    offsets: List[int] = []
+    position = 0
+    for text in texts:
+        offsets.append(position)
+        position += len(text) + 1
+
+    matched_indices = {
+        bisect.bisect_right(offsets, match.start()) - 1
+        for match in _KEYWORD_RE.finditer(blob)
+    }
+    return [projects[i] for i in sorted(matched_indices)]
 
 
 def format_approval_date(project: Dict) -> str:
-    """Extract a human-friendly approval date from the project payload."""
+    """Extract a human-friendly approval date from a normalized project."""
 
-    raw_date = project.get("boardapprovaldate")
-    if isinstance(raw_date, str) and raw_date:
+    raw_date = project["boardapprovaldate"]
+    if raw_date:
         # Common API format is ISO8601; we simply trim to date portion.
         return raw_date.split("T", 1)[0]
     return "N/A"
@@ -498,36 +787,31 @@ def format_approval_date(project: Dict) -> str:
 def get_project_last_update(project: Dict) -> str:
     """Return a string marker for when the project was last updated.
 
-    Prefers ``p2a_updated_date`` if present, and falls back to an empty
-    string. The exact string is stored and compared; if it changes between
-    runs, the project is treated as "updated" for alerting purposes.
+    Reads ``p2a_updated_date`` from a normalized project (empty when the
+    API did not provide one). The exact string is stored and compared; if
+    it changes between runs, the project is treated as "updated" for
+    alerting purposes.
     """
 
-    updated = project.get("p2a_updated_date") or ""
-    if isinstance(updated, str):
-        return updated
-    return ""
+    return project["p2a_updated_date"]
 
 
 def format_total_amount(project: Dict) -> str:
-    """Extract the total funding amount as a string.
+    """Extract the total funding amount from a normalized project.
 
-    Prefers `totalamt`, falling back to `totalcommamt`.
+    Prefers `totalamt`, falling back to `totalcommamt`. The API tends to
+    return values like "200,000,000".
     """
 
-    amount = project.get("totalamt") or project.get("totalcommamt")
-    if not isinstance(amount, str):
-        return "N/A"
-
-    # The API tends to return values like "200,000,000".
-    return f"${amount}"
+    amount = project["totalamt"] or project["totalcommamt"]
+    return f"${amount}" if amount else "N/A"
 
 
 def get_project_url(project: Dict) -> str:
-    """Return the World Bank project detail URL."""
+    """Return the World Bank project detail URL for a normalized project."""
 
-    url = project.get("url")
-    if isinstance(url, str) and url:
+    url = project["url"]
+    if url:
         return url
 
     project_id = str(project.get("id") or "").strip()
@@ -540,6 +824,17 @@ def get_project_url(project: Dict) -> str:
     return "https://projects.worldbank.org/en/projects-operations/projects-overview"
 
 
+# Everything after the project name in the contractor search query is
+# constant, so encode it once at import instead of re-quoting the ~30
+# search terms on every call. quote_plus encodes character by character,
+# which makes the concatenation below identical to quoting the whole
+# query in one go.
+_CONTRACTOR_QUERY_SUFFIX = quote_plus(
+    "+"
+    + "+".join([f'"{term}"' for term in CONTRACTOR_SEARCH_TERMS] + ['"contractor"'])
+)
+
+
 def build_contractor_search_url(project_name: str) -> str:
     """Construct a Google search URL to discover potential contractors.
 
@@ -548,15 +843,8 @@ def build_contractor_search_url(project_name: str) -> str:
       "World+Bank"+"[Project Name]"+<GIS terms>+"contractor"
     """
 
-    # Construct the raw query with quotes around terms, then URL-encode it.
-    terms: List[str] = [f'"World Bank"', f'"{project_name}"']
-    for term in CONTRACTOR_SEARCH_TERMS:
-        terms.append(f'"{term}"')
-    terms.append('"contractor"')
-
-    query = "+".join(terms)
-    encoded_query = quote_plus(query)
-    return f"https://www.google.com/search?q={encoded_query}"
+    prefix = quote_plus(f'"World Bank"+"{project_name}"')
+    return f"https://www.google.com/search?q={prefix}{_CONTRACTOR_QUERY_SUFFIX}"
 
 
 def send_discord_heartbeat(
@@ -587,7 +875,7 @@ def send_discord_heartbeat(
                 "inline": True,
             },
             {
-                "name": "GIS-Related Projects Found",
+                "name": "New/Updated GIS Projects Found",
                 "value": str(matching_projects),
                 "inline": True,
             },
@@ -610,7 +898,6 @@ def send_discord_heartbeat(
     response = post_with_retries(
         DISCORD_WEBHOOK_URL,
         payload=payload,
-        headers={"User-Agent": "WB-GIS-Monitor/1.0"},
     )
     if response is None:
         LOGGER.error("Discord heartbeat request failed after retries.")
@@ -633,25 +920,16 @@ def send_discord_heartbeat(
 # ---------------------------------------------------------------------------
 
 
-def send_discord_embed(project: Dict) -> bool:
-    """Send a single project summary as a Discord embed.
-
-    Returns True if the request appears to succeed, False otherwise.
-    """
-
-    if not DISCORD_WEBHOOK_URL or "REPLACE_ME" in DISCORD_WEBHOOK_URL:
-        LOGGER.warning(
-            "DISCORD_WEBHOOK_URL is not configured; skipping send.",
-        )
-        return False
+def _build_project_embed(project: Dict) -> Dict:
+    """Build the Discord embed payload for a single project."""
 
-    project_name = project.get("project_name") or "(No title)"
+    project_name = project["project_name"] or "(No title)"
     project_id = str(project.get("id") or "").strip() or "(unknown)"
 
     approval_date = format_approval_date(project)
     total_amount = format_total_amount(project)
     project_url = get_project_url(project)
-    contractor_url = build_contractor_search_url(str(project_name))
+    contractor_url = build_contractor_search_url(project_name)
 
     embed = {
         "title": project_name,
@@ -689,25 +967,42 @@ def send_discord_embed(project: Dict) -> bool:
         },
     }
 
+    return embed
+
+
+def send_discord_embeds_batch(projects: List[Dict]) -> bool:
+    """Send up to 10 project summaries in a single webhook message.
+
+    Returns True if the request appears to succeed, False otherwise.
+    """
+
+    if not DISCORD_WEBHOOK_URL or "REPLACE_ME" in DISCORD_WEBHOOK_URL:
+        LOGGER.warning(
+            "DISCORD_WEBHOOK_URL is not configured; skipping send.",
+        )
+        return False
+
     payload = {
         "username": "World Bank GIS Monitor",
-        "embeds": [embed],
+        "embeds": [_build_project_embed(project) for project in projects],
     }
 
     response = post_with_retries(
         DISCORD_WEBHOOK_URL,
         payload=payload,
-        headers={"User-Agent": "WB-GIS-Monitor/1.0"},
     )
     if response is None:
         LOGGER.error(
-            "Discord webhook request failed for project %s after retries.",
-            project_id,
+            "Discord webhook request failed for %d project(s) after retries.",
+            len(projects),
         )
         return False
 
     if 200 <= response.status_code < 300:
-        LOGGER.info("Sent Discord notification for project %s.", project_id)
+        LOGGER.info(
+            "Sent Discord notification with %d project embed(s).",
+            len(projects),
+        )
         return True
 
     LOGGER.error(
@@ -724,6 +1019,21 @@ def send_discord_embed(project: Dict) -> bool:
 # ---------------------------------------------------------------------------
 
 
+def _notify_projects_chunk(chunk: List[tuple]) -> List[tuple]:
+    """Send one batched webhook message and pace the worker for rate limits.
+
+    ``chunk`` holds (project, project_id, current_update) tuples; the
+    returned tuples carry the shared send result for each project.
+    """
+
+    sent = send_discord_embeds_batch([project for project, _, _ in chunk])
+    sleep(DISCORD_SEND_INTERVAL_SECONDS)
+    return [
+        (project_id, current_update, sent)
+        for _, project_id, current_update in chunk
+    ]
+
+
 def run_monitor() -> None:
     """Main orchestration for fetching, filtering, and notifying."""
 
@@ -753,20 +1063,35 @@ def run_monitor() -> None:
                 save_monitor_state(state)
         return
 
-    # Filter for GIS-related projects.
-    matching_projects: List[Dict] = []
+    # Drop projects whose last-update marker is unchanged since the
+    # previous run before scanning for keywords -- in steady state that
+    # is almost all of them, so the regex sweep only sees the delta.
+    candidates: List[Dict] = []
     for project in projects:
-        if project_matches_keywords(project, KEYWORDS):
-            matching_projects.append(project)
+        project_id = str(project.get("id") or "").strip()
+        if project_id and processed_projects.get(project_id) == get_project_last_update(
+            project
+        ):
+            continue
+        candidates.append(project)
+
+    LOGGER.info(
+        "%d of %d projects are new or updated since the last run.",
+        len(candidates),
+        total_projects,
+    )
+
+    # Filter the remaining candidates for GIS relevance in one regex sweep.
+    matching_projects: List[Dict] = filter_matching_projects(candidates)
 
     matching_count = len(matching_projects)
     LOGGER.info(
-        "Found %d GIS-related projects in Nigeria.",
+        "Found %d GIS-related projects among new/updated ones.",
         matching_count,
     )
 
     if not matching_projects:
-        LOGGER.info("No GIS-related projects found today.")
+        LOGGER.info("No new or updated GIS-related projects found today.")
 
         # Still optionally send a heartbeat to confirm the system is alive.
         today = date.today().isoformat()
@@ -780,47 +1105,62 @@ def run_monitor() -> None:
 
     # Send notifications only for projects that are new or have a changed
     # last-update marker since the last run.
-    new_or_updated_count = 0
-
+    to_notify: List[tuple] = []
     for project in matching_projects:
         project_id = str(project.get("id") or "").strip()
         if not project_id:
             continue
 
+        # Candidates are pre-filtered to new/updated projects, so every
+        # match here gets notified.
         current_update = get_project_last_update(project)
         previous_update = processed_projects.get(project_id)
 
-        if previous_update is not None and previous_update == current_update:
-            # Already seen this version of the project.
-            continue
-
         if previous_update is None:
-            LOGGER.info("Sending notification for NEW project %s...", project_id)
+            LOGGER.info("Queueing notification for NEW project %s...", project_id)
         else:
             LOGGER.info(
-                "Sending notification for UPDATED project %s (was %s, now %s)...",
+                "Queueing notification for UPDATED project %s (was %s, now %s)...",
                 project_id,
                 previous_update,
                 current_update,
             )
 
-        sent = send_discord_embed(project)
-        if sent:
-            processed_projects[project_id] = current_update
-            new_or_updated_count += 1
+        to_notify.append((project, project_id, current_update))
+
+    # Fan the webhook posts out over a bounded thread pool in batches of
+    # up to 10 embeds per message; each worker paces itself so the
+    # combined rate respects Discord's limits.
+    new_or_updated_count = 0
+    if to_notify:
+        chunks = [
+            to_notify[i : i + DISCORD_MAX_EMBEDS_PER_MESSAGE]
+            for i in range(0, len(to_notify), DISCORD_MAX_EMBEDS_PER_MESSAGE)
+        ]
+        with ThreadPoolExecutor(max_workers=DISCORD_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(_notify_projects_chunk, chunk) for chunk in chunks
+            ]
+            for future in as_completed(futures):
+                for project_id, current_update, sent in future.result():
+                    if sent:
+                        processed_projects[project_id] = current_update
+                        new_or_updated_count += 1
 
     LOGGER.info(
         "Completed notifications; %d new/updated projects were notified.",
         new_or_updated_count,
     )
 
-    # Persist updated project state.
-    save_processed_projects(processed_projects)
-    LOGGER.info(
-        "Saved %d processed projects to %s.",
-        len(processed_projects),
-        PROCESSED_IDS_FILE,
-    )
+    # Persist updated project state; flush() is a no-op when nothing
+    # changed this run.
+    written = save_processed_projects(processed_projects)
+    if written:
+        LOGGER.info(
+            "Saved %d new/updated project entries to %s.",
+            written,
+            PROCESSED_IDS_DB,
+        )
 
     # Weekly heartbeat (e.g. every Monday) so you know the monitor is alive
     # even if there are zero new projects on some days.
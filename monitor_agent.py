@@ -29,14 +29,20 @@ The script is built to be safe for PythonAnywhere free tier:
 
 from __future__ import annotations
 
+import atexit
+import functools
 import json
 import logging
+import math
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from time import sleep
-from typing import Any, Dict, Iterable, List
+from typing import Any, Callable, Dict, List
 
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import quote_plus
 
 
@@ -54,6 +60,10 @@ DISCORD_WEBHOOK_URL = (
     else "https://discordapp.com/api/webhooks/REPLACE_ME"
 )
 
+# Resolved once at import; every sender and the per-stream alert loops
+# check this flag instead of re-scanning the URL on each call.
+WEBHOOK_ENABLED = bool(DISCORD_WEBHOOK_URL) and "REPLACE_ME" not in DISCORD_WEBHOOK_URL
+
 # State files (stored in the same directory as the script).
 PROJECTS_STATE_FILE = "processed_projects.json"
 DOCS_STATE_FILE = "processed_docs.json"
@@ -76,11 +86,40 @@ AWARD_ASSET_ID = "DS01666"  # Contract awards.
 ENABLE_TENDERS_STREAM = False
 ENABLE_AWARDS_STREAM = False
 
+# Discord allows up to 10 embeds per webhook message; batching to that
+# limit turns N alert posts into ceil(N / 10).
+DISCORD_MAX_EMBEDS_PER_MESSAGE = 10
+
+# Parallel workers for prefetching Projects API pages once page 1 has
+# revealed the total row count; kept low to stay polite to the WB API.
+WB_PAGE_FETCH_WORKERS = 4
+
 # HTTP timeout and retry behaviour.
 HTTP_TIMEOUT = 15
 MAX_RETRIES = 3
 RETRY_BACKOFF_SECONDS = 3
 
+# Shared HTTP session: all traffic goes to a handful of hosts (World
+# Bank APIs and the Discord webhook), so keep-alive connection reuse
+# saves a TCP + TLS handshake on every call after the first. Retries
+# stay in the helpers below (max_retries=0 here) so the existing
+# backoff semantics are unchanged.
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {
+        "User-Agent": "WB-GIS-Monitor-Agent/1.0",
+        "Connection": "keep-alive",
+        # Ask for compressed responses explicitly; WB JSON payloads
+        # shrink several-fold on the wire and requests decompresses
+        # transparently.
+        "Accept-Encoding": "gzip, deflate",
+    }
+)
+_ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+atexit.register(_SESSION.close)
+
 # Country code for Nigeria.
 NIGERIA_COUNTRY_CODE = "NG"
 
@@ -188,6 +227,37 @@ KEYWORDS: List[str] = [
     "Service Coverage Mapping",
 ]
 
+def _prune_redundant_terms(terms: List[str]) -> List[str]:
+    """Deduplicate terms and drop those containing a shorter term.
+
+    Matching is case-insensitive, so a text that contains "Parcel
+    Mapping" necessarily contains "Map"; keeping the longer term only
+    adds scanning work without changing any outcome. Returns the kept
+    terms lowercased, shortest first.
+    """
+
+    kept: List[str] = []
+    for term in sorted({t.lower() for t in terms}, key=len):
+        if not any(shorter in term for shorter in kept):
+            kept.append(term)
+    return kept
+
+
+# Deduplicated keyword list: roughly half of KEYWORDS are superstrings
+# of another entry ("Mapping" vs "Map", "Spatial Data" vs "Spatial").
+_PRUNED_KEYWORDS = _prune_redundant_terms(KEYWORDS)
+
+# Single compiled alternation over the pruned keywords: one linear scan
+# of each text blob instead of one substring pass per keyword.
+# Longest-first keeps the alternation deterministic; IGNORECASE replaces
+# the per-call lower() copies.
+_KEYWORD_RE = re.compile(
+    "|".join(
+        re.escape(k) for k in sorted(_PRUNED_KEYWORDS, key=len, reverse=True)
+    ),
+    re.IGNORECASE,
+)
+
 
 # Extra terms to enrich contractor-oriented Google search queries.
 CONTRACTOR_SEARCH_TERMS: List[str] = [
@@ -230,39 +300,51 @@ CONTRACTOR_SEARCH_TERMS: List[str] = [
     "engineering firm",
 ]
 
+# Same pruning as the keywords: a result containing "cadastral mapping"
+# already contains "mapping", so only the shortest distinct terms go
+# into the search query.
+_PRUNED_CONTRACTOR_TERMS = _prune_redundant_terms(CONTRACTOR_SEARCH_TERMS)
+
 
 # ---------------------------------------------------------------------------
 # Generic utilities
 # ---------------------------------------------------------------------------
 
 
-def get_with_retries(
+# Status codes worth another attempt; 429 honours the server's
+# Retry-After header (Discord sends it on webhook rate limits).
+RETRYABLE_STATUS_CODES = (429, 502, 503, 504)
+
+# Never sleep longer than this on a Retry-After header -- a stalled
+# scheduled run is worse than a dropped alert.
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+def _request_with_retries(
+    method: str,
     url: str,
     *,
-    params: Dict[str, Any] | None = None,
-    headers: Dict[str, str] | None = None,
     timeout: int = HTTP_TIMEOUT,
     max_retries: int = MAX_RETRIES,
+    **kwargs: Any,
 ) -> requests.Response | None:
-    """Perform a GET request with basic retry logic.
+    """Issue an HTTP request, retrying errors and retryable statuses.
 
-    Returns the last successful response or None if all attempts fail.
+    Network failures back off linearly as before; a retryable status
+    (429/502/503/504) sleeps for the server's Retry-After value when one
+    is sent, falling back to the linear backoff. Returns the last
+    response, or None if every attempt raised.
     """
 
-    attempt = 1
-    while attempt <= max_retries:
+    response: requests.Response | None = None
+    for attempt in range(1, max_retries + 1):
         try:
-            response = requests.get(
-                url,
-                params=params,
-                headers=headers,
-                timeout=timeout,
-            )
-            return response
+            response = _SESSION.request(method, url, timeout=timeout, **kwargs)
         except requests.RequestException as exc:  # pragma: no cover - network
             if attempt == max_retries:
                 LOGGER.error(
-                    "GET %s failed after %d attempts: %s",
+                    "%s %s failed after %d attempts: %s",
+                    method,
                     url,
                     attempt,
                     exc,
@@ -270,16 +352,61 @@ def get_with_retries(
                 return None
 
             LOGGER.warning(
-                "GET %s failed on attempt %d/%d: %s; retrying...",
+                "%s %s failed on attempt %d/%d: %s; retrying...",
+                method,
                 url,
                 attempt,
                 max_retries,
                 exc,
             )
             sleep(RETRY_BACKOFF_SECONDS * attempt)
-            attempt += 1
+            continue
 
-    return None
+        if response.status_code not in RETRYABLE_STATUS_CODES:
+            return response
+        if attempt == max_retries:
+            return response
+
+        try:
+            retry_after = min(
+                float(response.headers.get("Retry-After", "")),
+                MAX_RETRY_AFTER_SECONDS,
+            )
+        except ValueError:
+            retry_after = float(RETRY_BACKOFF_SECONDS * attempt)
+
+        LOGGER.warning(
+            "%s %s returned %d on attempt %d/%d; retrying in %.1fs...",
+            method,
+            url,
+            response.status_code,
+            attempt,
+            max_retries,
+            retry_after,
+        )
+        sleep(retry_after)
+
+    return response
+
+
+def get_with_retries(
+    url: str,
+    *,
+    params: Dict[str, Any] | None = None,
+    headers: Dict[str, str] | None = None,
+    timeout: int = HTTP_TIMEOUT,
+    max_retries: int = MAX_RETRIES,
+) -> requests.Response | None:
+    """Perform a GET request with retry/backoff handling."""
+
+    return _request_with_retries(
+        "GET",
+        url,
+        params=params,
+        headers=headers,
+        timeout=timeout,
+        max_retries=max_retries,
+    )
 
 
 def post_with_retries(
@@ -290,68 +417,74 @@ def post_with_retries(
     timeout: int = HTTP_TIMEOUT,
     max_retries: int = MAX_RETRIES,
 ) -> requests.Response | None:
-    """Perform a POST request with basic retry logic."""
+    """Perform a POST request with retry/backoff handling."""
+
+    return _request_with_retries(
+        "POST",
+        url,
+        json=payload,
+        headers=headers,
+        timeout=timeout,
+        max_retries=max_retries,
+    )
 
-    attempt = 1
-    while attempt <= max_retries:
-        try:
-            response = requests.post(
-                url,
-                json=payload,
-                headers=headers,
-                timeout=timeout,
-            )
-            return response
-        except requests.RequestException as exc:  # pragma: no cover - network
-            if attempt == max_retries:
-                LOGGER.error(
-                    "POST %s failed after %d attempts: %s",
-                    url,
-                    attempt,
-                    exc,
-                )
-                return None
 
-            LOGGER.warning(
-                "POST %s failed on attempt %d/%d: %s; retrying...",
-                url,
-                attempt,
-                max_retries,
-                exc,
-            )
-            sleep(RETRY_BACKOFF_SECONDS * attempt)
-            attempt += 1
+def _str(value: Any) -> str:
+    """Return ``value`` if it is exactly a str, else "".
 
-    return None
+    Comparing ``__class__`` directly skips isinstance's subclass
+    machinery; these coercions run several times per record across
+    hundreds of records.
+    """
 
+    return value if value.__class__ is str else ""
 
-def text_matches_keywords(text: str, keywords: Iterable[str]) -> bool:
-    """Return True if any keyword is found in the given text (case-insensitive)."""
 
-    if not text:
-        return False
-    lower_text = text.lower()
-    for kw in keywords:
-        if kw.lower() in lower_text:
-            return True
-    return False
+def _first_str(record: Dict[str, Any], keys: tuple) -> str:
+    """Return the first non-empty string value among ``keys`` in record."""
+
+    for key in keys:
+        value = _str(record.get(key))
+        if value:
+            return value
+    return ""
+
+
+def text_matches_keywords(text: str) -> bool:
+    """Return True if any GIS keyword is found in the given text.
+
+    The check is case-insensitive and runs as a single scan of the
+    precompiled keyword regex.
+    """
+
+    return bool(text) and _KEYWORD_RE.search(text) is not None
+
+
+# Everything after the project name in the contractor query is constant,
+# so it is quoted and encoded once at import. quote_plus encodes
+# character by character, which makes concatenating separately-encoded
+# fragments identical to encoding the whole query at once.
+_CONTRACTOR_QUERY_SUFFIX = quote_plus(
+    "+"
+    + "+".join(
+        [f'"{term}"' for term in _PRUNED_CONTRACTOR_TERMS] + ['"contractor"']
+    )
+)
 
 
+@functools.lru_cache(maxsize=512)
 def build_contractor_search_url(project_name: str) -> str:
     """Build a Google search URL focused on contractor discovery.
 
     Logic (extended):
     https://www.google.com/search?q="World+Bank"+"[Project Name]"+<GIS terms>+"contractor"
-    """
 
-    terms: List[str] = [f'"World Bank"', f'"{project_name}"']
-    for term in CONTRACTOR_SEARCH_TERMS:
-        terms.append(f'"{term}"')
-    terms.append('"contractor"')
+    Cached per project name, since the same project is alerted again on
+    every update event.
+    """
 
-    query = "+".join(terms)
-    encoded_query = quote_plus(query)
-    return f"https://www.google.com/search?q={encoded_query}"
+    prefix = quote_plus(f'"World Bank"+"{project_name}"')
+    return f"https://www.google.com/search?q={prefix}{_CONTRACTOR_QUERY_SUFFIX}"
 
 
 # ---------------------------------------------------------------------------
@@ -359,39 +492,129 @@ def build_contractor_search_url(project_name: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+# Snapshot of each state map as loaded, so _save_state_map can append
+# only the entries that actually changed this run, plus the current line
+# count of each log for the compaction heuristic.
+_STATE_SNAPSHOTS: Dict[str, Dict[str, str]] = {}
+_STATE_LOG_LINES: Dict[str, int] = {}
+
+
+def _state_log_path(path: str) -> str:
+    """Return the append-only JSONL log path for a state file."""
+
+    return os.path.splitext(path)[0] + ".jsonl"
+
+
 def _load_state_map(path: str) -> Dict[str, str]:
     """Load a mapping of ID -> last_update string from disk.
 
-    Returns an empty dict on any error or if the file does not exist.
+    State lives in an append-only JSONL log (one ``{"id", "u"}`` record
+    per line, last write wins), so the daily save appends a handful of
+    lines instead of rewriting the whole mapping. A legacy ``.json``
+    file, if still present, is folded in as the base layer. Returns an
+    empty dict on any error.
     """
 
-    if not os.path.exists(path):
-        return {}
+    mapping: Dict[str, str] = {}
 
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            data = None
+
+        if isinstance(data, dict):
+            mapping = {str(k): str(v) for k, v in data.items()}
+        elif isinstance(data, list):
+            # Legacy format: list of IDs only.
+            mapping = {str(item): "" for item in data}
+
+    log_path = _state_log_path(path)
+    lines = 0
+    if os.path.exists(log_path):
+        try:
+            with open(log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(entry, dict) and "id" in entry:
+                        mapping[str(entry["id"])] = str(entry.get("u", ""))
+                        lines += 1
+        except OSError:
+            pass
+
+    _STATE_SNAPSHOTS[path] = dict(mapping)
+    _STATE_LOG_LINES[path] = lines
+    return mapping
+
+
+def _compact_state_log(path: str, mapping: Dict[str, str]) -> None:
+    """Rewrite the JSONL log with one deduplicated line per entry."""
+
+    log_path = _state_log_path(path)
+    tmp_path = log_path + ".tmp"
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except (OSError, json.JSONDecodeError):
-        return {}
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for key, value in mapping.items():
+                f.write(
+                    json.dumps({"id": key, "u": value}, separators=(",", ":"))
+                    + "\n"
+                )
+        os.replace(tmp_path, log_path)
+    except OSError as exc:
+        LOGGER.error("Failed to compact state log %s: %s", log_path, exc)
+        return
 
-    if isinstance(data, dict):
-        return {str(k): str(v) for k, v in data.items()}
+    # The legacy full-map file is superseded once the log holds everything.
+    if os.path.exists(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    _STATE_LOG_LINES[path] = len(mapping)
 
-    if isinstance(data, list):
-        # Legacy format: list of IDs only.
-        return {str(item): "" for item in data}
 
-    return {}
+def _save_state_map(path: str, mapping: Dict[str, str]) -> int:
+    """Persist mapping changes by appending to the JSONL log.
 
+    Only entries added or changed since _load_state_map are written --
+    O(changed) per run instead of O(all-history). Once the log grows
+    past twice the mapping size it is compacted back to one line per
+    entry. Returns the number of entries appended.
+    """
 
-def _save_state_map(path: str, mapping: Dict[str, str]) -> None:
-    """Persist mapping of ID -> last_update string to disk."""
+    snapshot = _STATE_SNAPSHOTS.get(path, {})
+    changed = {k: v for k, v in mapping.items() if snapshot.get(k) != v}
+    if not changed:
+        return 0
 
+    log_path = _state_log_path(path)
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(mapping, f, indent=2)
+        with open(log_path, "a", encoding="utf-8") as f:
+            for key, value in changed.items():
+                f.write(
+                    json.dumps({"id": key, "u": value}, separators=(",", ":"))
+                    + "\n"
+                )
     except OSError as exc:
-        LOGGER.error("Failed to save state to %s: %s", path, exc)
+        LOGGER.error("Failed to save state to %s: %s", log_path, exc)
+        return 0
+
+    _STATE_SNAPSHOTS[path] = dict(mapping)
+    lines = _STATE_LOG_LINES.get(path, 0) + len(changed)
+    _STATE_LOG_LINES[path] = lines
+
+    if lines > 2 * len(mapping):
+        _compact_state_log(path, mapping)
+
+    return len(changed)
 
 
 def load_monitor_state(path: str = MONITOR_STATE_FILE) -> Dict[str, str]:
@@ -406,76 +629,215 @@ def save_monitor_state(state: Dict[str, str], path: str = MONITOR_STATE_FILE) ->
     _save_state_map(path, state)
 
 
+def send_embeds_batch(embeds: List[Dict[str, Any]], log_kind: str) -> bool:
+    """Send up to 10 embeds in a single Discord webhook message.
+
+    Returns True if the request appears to succeed, False otherwise.
+    """
+
+    if not WEBHOOK_ENABLED:
+        LOGGER.warning(
+            "Webhook URL not configured; skipping %s alert(s).", log_kind
+        )
+        return False
+
+    payload = {
+        "username": "World Bank GIS Monitor",
+        "embeds": embeds,
+    }
+
+    response = post_with_retries(
+        DISCORD_WEBHOOK_URL,
+        payload=payload,
+    )
+    if response is None:
+        LOGGER.error("%s alert webhook failed after retries.", log_kind)
+        return False
+
+    if 200 <= response.status_code < 300:
+        LOGGER.info("Sent %d %s alert embed(s).", len(embeds), log_kind)
+        return True
+
+    LOGGER.error(
+        "%s alert webhook returned %s: %s",
+        log_kind,
+        response.status_code,
+        response.text,
+    )
+    return False
+
+
+def _send_pending_alerts(
+    pending: List[tuple],
+    state: Dict[str, str],
+    log_kind: str,
+) -> int:
+    """Send queued (record_id, last_update, embed) alerts in 10-embed batches.
+
+    On batch success every record in the batch is marked processed in
+    ``state``. Returns the number of alerts delivered.
+    """
+
+    sent_count = 0
+    for start in range(0, len(pending), DISCORD_MAX_EMBEDS_PER_MESSAGE):
+        batch = pending[start : start + DISCORD_MAX_EMBEDS_PER_MESSAGE]
+        if not send_embeds_batch([embed for _, _, embed in batch], log_kind):
+            continue
+        for record_id, last_update, _ in batch:
+            state[record_id] = last_update
+            sent_count += 1
+    return sent_count
+
+
+def _run_stream(
+    log_kind: str,
+    records: List[Dict[str, Any]],
+    matcher: Callable[[Dict[str, Any]], bool],
+    id_fn: Callable[[Dict[str, Any]], str],
+    update_fn: Callable[[Dict[str, Any]], str],
+    build_embed: Callable[[Dict[str, Any], bool], Dict[str, Any]],
+    state: Dict[str, str],
+) -> int:
+    """Scan one stream's records and alert on the new or updated ones.
+
+    Filters ``records`` with ``matcher``, drops anything whose
+    ``update_fn`` marker is unchanged in ``state`` or already queued
+    this run, builds embeds for the remainder, and delivers them in
+    batches. Returns the number of alerts delivered.
+    """
+
+    matching = [record for record in records if matcher(record)]
+    LOGGER.info("%d GIS-related %s record(s).", len(matching), log_kind)
+
+    if not WEBHOOK_ENABLED or not matching:
+        return 0
+
+    pending: List[tuple] = []
+    # The APIs occasionally repeat a record across pages; track what has
+    # already been queued this run.
+    seen: set = set()
+    for record in matching:
+        record_id = id_fn(record)
+        if not record_id:
+            continue
+
+        current_update = update_fn(record)
+        previous_update = state.get(record_id)
+
+        if previous_update is not None and previous_update == current_update:
+            continue
+
+        seen_key = (record_id, current_update)
+        if seen_key in seen:
+            continue
+        seen.add(seen_key)
+
+        is_update = previous_update is not None
+        LOGGER.info(
+            "New/updated %s %s detected (was %s, now %s).",
+            log_kind,
+            record_id,
+            previous_update,
+            current_update,
+        )
+        pending.append(
+            (record_id, current_update, build_embed(record, is_update))
+        )
+
+    return _send_pending_alerts(pending, state, log_kind)
+
+
 # ---------------------------------------------------------------------------
 # Stream 1: Projects
 # ---------------------------------------------------------------------------
 
 
-def fetch_projects_for_nigeria(rows_per_page: int = 50) -> List[Dict[str, Any]]:
-    """Fetch active World Bank projects for Nigeria.
+def _fetch_projects_page(page: int, rows_per_page: int) -> Dict[str, Any] | None:
+    """Fetch and decode one page of the Projects API.
 
-    Uses the search.worldbank.org Projects API.
+    Returns the parsed payload, or None on any HTTP or parse error.
     """
 
-    all_projects: List[Dict[str, Any]] = []
-    page = 1
-
-    while True:
-        params = {
-            "format": "json",
-            "status": "Active",
-            # countrycode_exact hint; we'll still filter client-side as backup.
-            "countrycode_exact": NIGERIA_COUNTRY_CODE,
-            "rows": rows_per_page,
-            "page": page,
-        }
-
-        response = get_with_retries(
-            WB_PROJECTS_API_URL,
-            params=params,
-            headers={"User-Agent": "WB-GIS-Monitor-Agent/1.0"},
-        )
-        if response is None:
-            LOGGER.error("Failed to fetch projects page %d.", page)
-            break
+    params = {
+        "format": "json",
+        "status": "Active",
+        # countrycode_exact hint; we'll still filter client-side as backup.
+        "countrycode_exact": NIGERIA_COUNTRY_CODE,
+        "rows": rows_per_page,
+        "page": page,
+    }
 
-        try:
-            response.raise_for_status()
-        except requests.RequestException as exc:  # pragma: no cover - network
-            LOGGER.error("Projects API error on page %d: %s", page, exc)
-            break
+    response = get_with_retries(
+        WB_PROJECTS_API_URL,
+        params=params,
+    )
+    if response is None:
+        LOGGER.error("Failed to fetch projects page %d.", page)
+        return None
 
-        try:
-            payload = response.json()
-        except json.JSONDecodeError as exc:
-            LOGGER.error("Failed to parse JSON from Projects API: %s", exc)
-            break
+    try:
+        response.raise_for_status()
+    except requests.RequestException as exc:  # pragma: no cover - network
+        LOGGER.error("Projects API error on page %d: %s", page, exc)
+        return None
 
-        total = int(payload.get("total", 0))
-        rows = int(payload.get("rows", rows_per_page))
+    try:
+        # Decode the raw bytes directly; this skips requests' charset
+        # detection pass on large payloads.
+        return json.loads(response.content)
+    except json.JSONDecodeError as exc:
+        LOGGER.error("Failed to parse JSON from Projects API: %s", exc)
+        return None
 
-        projects = payload.get("projects") or {}
-        if not isinstance(projects, dict):
-            LOGGER.warning("Unexpected 'projects' structure from API.")
-            break
 
-        # Filter to projects where Nigeria (NG) is in the country code list.
-        for proj in projects.values():
-            country_codes = proj.get("countrycode") or []
-            if isinstance(country_codes, list) and NIGERIA_COUNTRY_CODE in country_codes:
-                all_projects.append(proj)
+def _extract_nigeria_projects(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Filter a page payload to projects that include Nigeria (NG)."""
 
-        LOGGER.info(
-            "Projects: page %d -> %d rows (total=%d).",
-            page,
-            len(projects),
-            total,
-        )
+    projects = payload.get("projects") or {}
+    if not isinstance(projects, dict):
+        LOGGER.warning("Unexpected 'projects' structure from API.")
+        return []
+
+    # `countrycode` is usually a list of codes but occasionally a bare
+    # string; `in` covers both shapes, and the () default swallows
+    # missing values without an isinstance ladder.
+    return [
+        proj
+        for proj in projects.values()
+        if NIGERIA_COUNTRY_CODE in (proj.get("countrycode") or ())
+    ]
 
-        if page * rows >= total or not projects:
-            break
 
-        page += 1
+def fetch_projects_for_nigeria(rows_per_page: int = 50) -> List[Dict[str, Any]]:
+    """Fetch active World Bank projects for Nigeria.
+
+    Uses the search.worldbank.org Projects API in two phases: page 1 is
+    fetched synchronously to learn the total row count, then any
+    remaining pages are fetched in parallel over the shared session
+    instead of one round trip per page.
+    """
+
+    payload = _fetch_projects_page(1, rows_per_page)
+    if payload is None:
+        return []
+
+    all_projects = _extract_nigeria_projects(payload)
+
+    total = int(payload.get("total", 0))
+    rows = int(payload.get("rows", rows_per_page)) or rows_per_page
+    n_pages = math.ceil(total / rows) if total else 1
+
+    LOGGER.info("Projects: page 1 of %d (total=%d).", n_pages, total)
+
+    if n_pages > 1:
+        with ThreadPoolExecutor(max_workers=WB_PAGE_FETCH_WORKERS) as executor:
+            page_payloads = executor.map(
+                lambda page: _fetch_projects_page(page, rows_per_page),
+                range(2, n_pages + 1),
+            )
+            for page_payload in page_payloads:
+                if page_payload is not None:
+                    all_projects.extend(_extract_nigeria_projects(page_payload))
 
     return all_projects
 
@@ -483,24 +845,31 @@ def fetch_projects_for_nigeria(rows_per_page: int = 50) -> List[Dict[str, Any]]:
 def extract_project_text(project: Dict[str, Any]) -> str:
     """Concatenate title and abstract-like fields into a single text blob."""
 
-    parts: List[str] = []
-    title = project.get("project_name") or ""
-    if isinstance(title, str):
-        parts.append(title)
-
+    parts = [_str(project.get("project_name"))]
     abstract = project.get("project_abstract")
     if isinstance(abstract, dict):
-        for value in abstract.values():
-            if isinstance(value, str):
-                parts.append(value)
+        parts.extend(_str(value) for value in abstract.values())
 
-    return " \n".join(parts)
+    return " \n".join(part for part in parts if part)
 
 
 def project_matches_keywords(project: Dict[str, Any]) -> bool:
-    """Return True if any GIS keyword is found in the project text."""
+    """Return True if any GIS keyword is found in the project text.
+
+    The title is checked first -- it carries most of the lexical signal
+    -- so the abstract walk and string join only happen on a miss.
+    """
+
+    title = project.get("project_name")
+    if isinstance(title, str) and text_matches_keywords(title):
+        return True
+    return text_matches_keywords(extract_project_text(project))
+
 
-    return text_matches_keywords(extract_project_text(project), KEYWORDS)
+def _get_project_id(project: Dict[str, Any]) -> str:
+    """Return the project ID as a stripped string."""
+
+    return str(project.get("id") or "").strip()
 
 
 def get_project_last_update(project: Dict[str, Any]) -> str:
@@ -509,17 +878,14 @@ def get_project_last_update(project: Dict[str, Any]) -> str:
     Uses `p2a_updated_date` if present, otherwise an empty string.
     """
 
-    updated = project.get("p2a_updated_date") or ""
-    if isinstance(updated, str):
-        return updated
-    return ""
+    return _str(project.get("p2a_updated_date"))
 
 
 def format_project_approval_date(project: Dict[str, Any]) -> str:
     """Return a human-friendly approval date for the project."""
 
-    raw_date = project.get("boardapprovaldate")
-    if isinstance(raw_date, str) and raw_date:
+    raw_date = _str(project.get("boardapprovaldate"))
+    if raw_date:
         return raw_date.split("T", 1)[0]
     return "N/A"
 
@@ -527,17 +893,15 @@ def format_project_approval_date(project: Dict[str, Any]) -> str:
 def format_project_total_amount(project: Dict[str, Any]) -> str:
     """Return the total funding amount for the project."""
 
-    amount = project.get("totalamt") or project.get("totalcommamt")
-    if isinstance(amount, str) and amount:
-        return f"${amount}"
-    return "N/A"
+    amount = _str(project.get("totalamt")) or _str(project.get("totalcommamt"))
+    return f"${amount}" if amount else "N/A"
 
 
 def get_project_url(project: Dict[str, Any]) -> str:
     """Return the World Bank project detail URL."""
 
-    url = project.get("url")
-    if isinstance(url, str) and url:
+    url = _str(project.get("url"))
+    if url:
         return url
 
     proj_id = str(project.get("id") or "").strip()
@@ -550,30 +914,47 @@ def get_project_url(project: Dict[str, Any]) -> str:
     return "https://projects.worldbank.org/en/projects-operations/projects-overview"
 
 
-def send_project_alert_embed(
+# Static embed scaffolding shared by every alert of a kind; builders
+# splice the per-record values over these instead of rebuilding the
+# constant parts on each call.
+_PROJECT_EMBED_TEMPLATE = {
+    "color": 0x1ABC9C,  # teal
+    "footer": {"text": "World Bank GIS Monitor (Projects, Nigeria)"},
+}
+_DOC_EMBED_TEMPLATE = {
+    "color": 0x2ECC71,  # green
+    "footer": {"text": "World Bank GIS Monitor (Procurement Plans, Nigeria)"},
+}
+_TENDER_EMBED_TEMPLATE = {
+    "color": 0xE67E22,  # orange
+    "footer": {"text": "World Bank GIS Monitor (Tenders, Nigeria)"},
+}
+_AWARD_EMBED_TEMPLATE = {
+    "color": 0xC0392B,  # red
+    "footer": {"text": "World Bank GIS Monitor (Awards, Nigeria)"},
+}
+
+
+def _build_project_embed(
     project: Dict[str, Any],
     is_update: bool,
-) -> bool:
-    """Send a Discord embed for a new or updated project plan."""
-
-    if not DISCORD_WEBHOOK_URL or "REPLACE_ME" in DISCORD_WEBHOOK_URL:
-        LOGGER.warning("Webhook URL not configured; skipping project alert.")
-        return False
+) -> Dict[str, Any]:
+    """Build a Discord embed for a new or updated project plan."""
 
-    project_name = project.get("project_name") or "(No title)"
+    project_name = _str(project.get("project_name")) or "(No title)"
     project_id = str(project.get("id") or "").strip() or "(unknown)"
 
     approval_date = format_project_approval_date(project)
     total_amount = format_project_total_amount(project)
     project_url = get_project_url(project)
-    contractor_url = build_contractor_search_url(str(project_name))
+    contractor_url = build_contractor_search_url(project_name)
 
     alert_type = "Project Update" if is_update else "New Project Plan"
 
-    embed = {
+    return {
+        **_PROJECT_EMBED_TEMPLATE,
         "title": f"{alert_type}: {project_name}",
         "url": project_url,
-        "color": 0x1ABC9C,  # teal
         "fields": [
             {"name": "Project ID", "value": project_id, "inline": True},
             {"name": "Approval Date", "value": approval_date, "inline": True},
@@ -589,36 +970,8 @@ def send_project_alert_embed(
                 "inline": False,
             },
         ],
-        "footer": {
-            "text": "World Bank GIS Monitor (Projects, Nigeria)",
-        },
-    }
-
-    payload = {
-        "username": "World Bank GIS Monitor",
-        "embeds": [embed],
     }
 
-    response = post_with_retries(
-        DISCORD_WEBHOOK_URL,
-        payload=payload,
-        headers={"User-Agent": "WB-GIS-Monitor-Agent/1.0"},
-    )
-    if response is None:
-        LOGGER.error("Project alert webhook failed after retries.")
-        return False
-
-    if 200 <= response.status_code < 300:
-        LOGGER.info("Sent project %s alert (update=%s).", project_id, is_update)
-        return True
-
-    LOGGER.error(
-        "Project alert webhook returned %s: %s",
-        response.status_code,
-        response.text,
-    )
-    return False
-
 
 # ---------------------------------------------------------------------------
 # Stream 2: Procurement Plan Documents (WDS /v3/wds)
@@ -643,7 +996,6 @@ def fetch_procurement_plans_for_nigeria(rows: int = 200) -> List[Dict[str, Any]]
     response = get_with_retries(
         WB_WDS_API_URL,
         params=params,
-        headers={"User-Agent": "WB-GIS-Monitor-Agent/1.0"},
     )
     if response is None:
         LOGGER.error("Failed to fetch procurement plan documents.")
@@ -656,7 +1008,7 @@ def fetch_procurement_plans_for_nigeria(rows: int = 200) -> List[Dict[str, Any]]
         return []
 
     try:
-        payload = response.json()
+        payload = json.loads(response.content)
     except json.JSONDecodeError as exc:
         LOGGER.error("Failed to parse JSON from WDS documents API: %s", exc)
         return []
@@ -677,43 +1029,44 @@ def fetch_procurement_plans_for_nigeria(rows: int = 200) -> List[Dict[str, Any]]
     return rows_list
 
 
+# Plain string fields folded into a WDS document's combined text.
+DOC_TEXT_KEYS = ("theme", "subsc")
+
+
 def extract_document_text(doc: Dict[str, Any]) -> str:
     """Extract a combined text field from a WDS document record."""
 
-    parts: List[str] = []
-
-    display_title = doc.get("display_title")
-    if isinstance(display_title, str):
-        parts.append(display_title)
+    parts: List[str] = [_str(doc.get("display_title"))]
 
     docna = doc.get("docna")
     if isinstance(docna, dict):
         for entry in docna.values():
             if isinstance(entry, dict):
-                title = entry.get("docna")
-                if isinstance(title, str):
-                    parts.append(title)
+                parts.append(_str(entry.get("docna")))
 
-    for key in ("theme", "subsc"):
-        value = doc.get(key)
-        if isinstance(value, str):
-            parts.append(value)
+    parts.extend(_str(doc.get(key)) for key in DOC_TEXT_KEYS)
 
     sectr = doc.get("sectr")
     if isinstance(sectr, dict):
         for entry in sectr.values():
             if isinstance(entry, dict):
-                sector = entry.get("sector")
-                if isinstance(sector, str):
-                    parts.append(sector)
+                parts.append(_str(entry.get("sector")))
 
-    return " \n".join(parts)
+    return " \n".join(part for part in parts if part)
 
 
 def document_matches_keywords(doc: Dict[str, Any]) -> bool:
-    """Return True if any GIS keyword is found in the document metadata text."""
+    """Return True if any GIS keyword is found in the document metadata text.
 
-    return text_matches_keywords(extract_document_text(doc), KEYWORDS)
+    The display title is checked first -- it carries most of the lexical
+    signal for procurement plans -- so the full metadata walk and join
+    only happen on a miss.
+    """
+
+    display_title = doc.get("display_title")
+    if isinstance(display_title, str) and text_matches_keywords(display_title):
+        return True
+    return text_matches_keywords(extract_document_text(doc))
 
 
 def get_document_id(doc: Dict[str, Any]) -> str:
@@ -726,61 +1079,54 @@ def get_document_id(doc: Dict[str, Any]) -> str:
 def get_document_last_update(doc: Dict[str, Any]) -> str:
     """Return last-modified marker for a WDS document."""
 
-    updated = doc.get("last_modified_date") or ""
-    if isinstance(updated, str):
-        return updated
-    return ""
+    return _str(doc.get("last_modified_date"))
 
 
 def get_document_urls(doc: Dict[str, Any]) -> tuple[str, str]:
     """Return (page_url, pdf_url) for the document, with safe fallbacks."""
 
-    page_url = doc.get("url")
-    if not isinstance(page_url, str) or not page_url:
-        page_url = "https://documents.worldbank.org/en/publication/documents-reports"
-
-    pdf_url = doc.get("pdfurl")
-    if not isinstance(pdf_url, str) or not pdf_url:
-        pdf_url = page_url
+    page_url = (
+        _str(doc.get("url"))
+        or "https://documents.worldbank.org/en/publication/documents-reports"
+    )
+    pdf_url = _str(doc.get("pdfurl")) or page_url
 
     return page_url, pdf_url
 
 
-def send_procurement_plan_alert_embed(doc: Dict[str, Any], is_update: bool) -> bool:
-    """Send a Discord embed for a new or updated procurement plan document."""
-
-    if not DISCORD_WEBHOOK_URL or "REPLACE_ME" in DISCORD_WEBHOOK_URL:
-        LOGGER.warning("Webhook URL not configured; skipping document alert.")
-        return False
+def _build_procurement_plan_embed(
+    doc: Dict[str, Any], is_update: bool
+) -> Dict[str, Any]:
+    """Build a Discord embed for a new or updated procurement plan document."""
 
     doc_id = get_document_id(doc) or "(unknown)"
 
-    project_id = doc.get("projectid") or "N/A"
-    project_name = doc.get("projn") or "(Unknown project)"
-    docty = doc.get("docty") or "Procurement Plan"
+    project_id = _str(doc.get("projectid")) or "N/A"
+    project_name = _str(doc.get("projn")) or "(Unknown project)"
+    docty = _str(doc.get("docty")) or "Procurement Plan"
 
     doc_date = (
-        doc.get("docdt")
-        or doc.get("disclosure_date")
-        or doc.get("datestored")
+        _str(doc.get("docdt"))
+        or _str(doc.get("disclosure_date"))
+        or _str(doc.get("datestored"))
         or "N/A"
     )
 
-    display_title = doc.get("display_title") or project_name
+    display_title = _str(doc.get("display_title")) or project_name
 
     page_url, pdf_url = get_document_urls(doc)
 
     alert_type = "Updated Procurement Plan" if is_update else "New Procurement Plan"
 
-    embed = {
+    return {
+        **_DOC_EMBED_TEMPLATE,
         "title": f"{alert_type}: {display_title}",
         "url": pdf_url,
-        "color": 0x2ECC71,  # green
         "fields": [
             {"name": "Document ID", "value": doc_id, "inline": True},
-            {"name": "Project ID", "value": str(project_id), "inline": True},
-            {"name": "Document Type", "value": str(docty), "inline": True},
-            {"name": "Document Date", "value": str(doc_date), "inline": True},
+            {"name": "Project ID", "value": project_id, "inline": True},
+            {"name": "Document Type", "value": docty, "inline": True},
+            {"name": "Document Date", "value": doc_date, "inline": True},
             {
                 "name": "Project / Document Page",
                 "value": f"[Open in Browser]({page_url})",
@@ -792,40 +1138,49 @@ def send_procurement_plan_alert_embed(doc: Dict[str, Any], is_update: bool) -> b
                 "inline": False,
             },
         ],
-        "footer": {
-            "text": "World Bank GIS Monitor (Procurement Plans, Nigeria)",
-        },
     }
 
-    payload = {
-        "username": "World Bank GIS Monitor",
-        "embeds": [embed],
-    }
 
-    response = post_with_retries(
-        DISCORD_WEBHOOK_URL,
-        payload=payload,
-        headers={"User-Agent": "WB-GIS-Monitor-Agent/1.0"},
-    )
-    if response is None:
-        LOGGER.error("Procurement plan alert webhook failed after retries.")
-        return False
+# ---------------------------------------------------------------------------
+# Stream 3: Procurement Notices / Tenders (Finances One DS00979)
+# ---------------------------------------------------------------------------
 
-    if 200 <= response.status_code < 300:
-        LOGGER.info("Sent procurement plan alert for document %s.", doc_id)
-        return True
 
-    LOGGER.error(
-        "Procurement plan alert webhook returned %s: %s",
-        response.status_code,
-        response.text,
-    )
-    return False
+# Discovered row-container key per Finances One stream. The shape of an
+# endpoint's response is stable, so it is probed once on the first
+# non-empty payload and then read directly.
+_CONTAINER_KEY: Dict[str, str | None] = {"tenders": None, "awards": None}
 
 
-# ---------------------------------------------------------------------------
-# Stream 3: Procurement Notices / Tenders (Finances One DS00979)
-# ---------------------------------------------------------------------------
+def _extract_rows(data: Any, stream: str) -> List[Dict[str, Any]]:
+    """Pull the row list out of a Finances One response payload.
+
+    Handles bare lists and dict containers; the dict key ("data" vs
+    "rows") is memoized per stream in _CONTAINER_KEY after the first
+    hit so later calls skip the probing.
+    """
+
+    if isinstance(data, list):
+        rows = data
+    elif isinstance(data, dict):
+        key = _CONTAINER_KEY.get(stream)
+        rows = data.get(key) or [] if key is not None else []
+        if not rows:
+            # First call, or the endpoint changed shape under us:
+            # (re-)probe the known container keys.
+            for candidate in ("data", "rows"):
+                rows = data.get(candidate) or []
+                if rows:
+                    _CONTAINER_KEY[stream] = candidate
+                    break
+    else:
+        rows = []
+
+    if not isinstance(rows, list):
+        LOGGER.warning("Unexpected %s data structure; skipping.", stream)
+        return []
+
+    return [r for r in rows if isinstance(r, dict)]
 
 
 def fetch_tenders_for_nigeria(limit: int = 500) -> List[Dict[str, Any]]:
@@ -855,7 +1210,6 @@ def fetch_tenders_for_nigeria(limit: int = 500) -> List[Dict[str, Any]]:
     response = get_with_retries(
         WB_FINANCES_DATA_URL,
         params=params,
-        headers={"User-Agent": "WB-GIS-Monitor-Agent/1.0"},
     )
     if response is None:
         LOGGER.error("Failed to fetch procurement notices.")
@@ -868,57 +1222,58 @@ def fetch_tenders_for_nigeria(limit: int = 500) -> List[Dict[str, Any]]:
         return []
 
     try:
-        data = response.json()
+        data = json.loads(response.content)
     except json.JSONDecodeError as exc:
         LOGGER.error("Failed to parse JSON from Tenders API: %s", exc)
         return []
 
-    # The Finances One API can return data under different keys; we try a
-    # couple of common patterns and fall back gracefully.
-    if isinstance(data, list):
-        rows = data
-    elif isinstance(data, dict):
-        rows = data.get("data") or data.get("rows") or []
-    else:
-        rows = []
+    rows = _extract_rows(data, "tenders")
+    LOGGER.info("Fetched %d procurement notices (raw).", len(rows))
+    return rows
 
-    if not isinstance(rows, list):
-        LOGGER.warning("Unexpected tenders data structure; skipping.")
-        return []
 
-    LOGGER.info("Fetched %d procurement notices (raw).", len(rows))
-    return [r for r in rows if isinstance(r, dict)]
+# Field orders for the best-effort tender extractors; module-level
+# tuples so each call iterates a cached constant.
+TENDER_TEXT_KEYS = (
+    "notice_title",
+    "tender_title",
+    "contract_title",
+    "description",
+    "summary",
+)
+TENDER_ID_KEYS = ("notice_id", "tender_id", "contract_id", "id")
+TENDER_UPDATE_KEYS = (
+    "updated_date",
+    "last_update_date",
+    "notice_publish_date",
+    "publish_date",
+)
+TENDER_URL_KEYS = ("url", "notice_url", "tender_url", "link")
 
 
 def extract_tender_text(record: Dict[str, Any]) -> str:
     """Extract a combined text field from a tender record."""
 
-    parts: List[str] = []
-
-    for key in (
-        "notice_title",
-        "tender_title",
-        "contract_title",
-        "description",
-        "summary",
-    ):
-        value = record.get(key)
-        if isinstance(value, str):
-            parts.append(value)
-
-    return " \n".join(parts)
+    parts = (_str(record.get(key)) for key in TENDER_TEXT_KEYS)
+    return " \n".join(part for part in parts if part)
 
 
 def tender_matches_keywords(record: Dict[str, Any]) -> bool:
-    """Return True if any GIS keyword is found in the tender text."""
+    """Return True if any GIS keyword is found in the tender text.
 
-    return text_matches_keywords(extract_tender_text(record), KEYWORDS)
+    Fields are scanned one at a time and the first hit wins, so the
+    joined text blob is never allocated on the matching path.
+    """
+
+    return any(
+        text_matches_keywords(_str(record.get(key))) for key in TENDER_TEXT_KEYS
+    )
 
 
 def get_tender_id(record: Dict[str, Any]) -> str:
     """Best-effort extraction of a stable tender / notice ID."""
 
-    for key in ("notice_id", "tender_id", "contract_id", "id"):
+    for key in TENDER_ID_KEYS:
         value = record.get(key)
         if value is not None:
             return str(value)
@@ -932,25 +1287,15 @@ def get_tender_last_update(record: Dict[str, Any]) -> str:
     candidates include `notice_publish_date`, `updated_date`, etc.
     """
 
-    for key in (
-        "updated_date",
-        "last_update_date",
-        "notice_publish_date",
-        "publish_date",
-    ):
-        value = record.get(key)
-        if isinstance(value, str):
-            return value
-    return ""
+    return _first_str(record, TENDER_UPDATE_KEYS)
 
 
 def get_tender_url(record: Dict[str, Any]) -> str:
     """Return a URL for the tender if present, or a generic fallback."""
 
-    for key in ("url", "notice_url", "tender_url", "link"):
-        value = record.get(key)
-        if isinstance(value, str) and value:
-            return value
+    url = _first_str(record, TENDER_URL_KEYS)
+    if url:
+        return url
 
     # Generic procurement search page as fallback.
     return (
@@ -959,12 +1304,8 @@ def get_tender_url(record: Dict[str, Any]) -> str:
     )
 
 
-def send_tender_alert_embed(record: Dict[str, Any]) -> bool:
-    """Send a Discord embed for a new GIS-related tender / EOI."""
-
-    if not DISCORD_WEBHOOK_URL or "REPLACE_ME" in DISCORD_WEBHOOK_URL:
-        LOGGER.warning("Webhook URL not configured; skipping tender alert.")
-        return False
+def _build_tender_embed(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a Discord embed for a new GIS-related tender / EOI."""
 
     tender_id = get_tender_id(record) or "(unknown)"
 
@@ -991,10 +1332,10 @@ def send_tender_alert_embed(record: Dict[str, Any]) -> bool:
 
     url = get_tender_url(record)
 
-    embed = {
+    return {
+        **_TENDER_EMBED_TEMPLATE,
         "title": f"New GIS Tender / EOI: {title}",
         "url": url,
-        "color": 0xE67E22,  # orange
         "fields": [
             {"name": "Notice / Tender ID", "value": tender_id, "inline": True},
             {"name": "Procurement Method", "value": method, "inline": True},
@@ -1005,36 +1346,8 @@ def send_tender_alert_embed(record: Dict[str, Any]) -> bool:
                 "inline": False,
             },
         ],
-        "footer": {
-            "text": "World Bank GIS Monitor (Tenders, Nigeria)",
-        },
     }
 
-    payload = {
-        "username": "World Bank GIS Monitor",
-        "embeds": [embed],
-    }
-
-    response = post_with_retries(
-        DISCORD_WEBHOOK_URL,
-        payload=payload,
-        headers={"User-Agent": "WB-GIS-Monitor-Agent/1.0"},
-    )
-    if response is None:
-        LOGGER.error("Tender alert webhook failed after retries.")
-        return False
-
-    if 200 <= response.status_code < 300:
-        LOGGER.info("Sent tender alert for %s.", tender_id)
-        return True
-
-    LOGGER.error(
-        "Tender alert webhook returned %s: %s",
-        response.status_code,
-        response.text,
-    )
-    return False
-
 
 # ---------------------------------------------------------------------------
 # Stream 3: Contract Awards (Finances One DS01666)
@@ -1065,7 +1378,6 @@ def fetch_awards_for_nigeria(limit: int = 500) -> List[Dict[str, Any]]:
     response = get_with_retries(
         WB_FINANCES_DATA_URL,
         params=params,
-        headers={"User-Agent": "WB-GIS-Monitor-Agent/1.0"},
     )
     if response is None:
         LOGGER.error("Failed to fetch contract awards.")
@@ -1078,54 +1390,69 @@ def fetch_awards_for_nigeria(limit: int = 500) -> List[Dict[str, Any]]:
         return []
 
     try:
-        data = response.json()
+        data = json.loads(response.content)
     except json.JSONDecodeError as exc:
         LOGGER.error("Failed to parse JSON from Awards API: %s", exc)
         return []
 
-    if isinstance(data, list):
-        rows = data
-    elif isinstance(data, dict):
-        rows = data.get("data") or data.get("rows") or []
-    else:
-        rows = []
+    rows = _extract_rows(data, "awards")
+    LOGGER.info("Fetched %d contract awards (raw).", len(rows))
+    return rows
 
-    if not isinstance(rows, list):
-        LOGGER.warning("Unexpected awards data structure; skipping.")
-        return []
 
-    LOGGER.info("Fetched %d contract awards (raw).", len(rows))
-    return [r for r in rows if isinstance(r, dict)]
+# Candidate text fields on an award record, in signal order, plus the
+# probe orders for the other best-effort award extractors.
+AWARD_TEXT_KEYS = (
+    "contract_title",
+    "description",
+    "procurement_description",
+    "project_name",
+)
+AWARD_ID_KEYS = ("contract_id", "award_id", "id")
+AWARD_UPDATE_KEYS = (
+    "updated_date",
+    "last_update_date",
+    "award_date",
+    "contract_sign_date",
+)
+AWARD_URL_KEYS = ("url", "contract_url", "link")
+AWARD_AMOUNT_KEYS = (
+    "contract_amount_usd",
+    "contract_value_usd",
+    "contract_value",
+    "amount",
+)
+AWARD_SUPPLIER_KEYS = (
+    "supplier_name",
+    "supplier",
+    "contractor_name",
+    "vendor_name",
+)
 
 
 def extract_award_text(record: Dict[str, Any]) -> str:
     """Extract a combined text field from an award record."""
 
-    parts: List[str] = []
-
-    for key in (
-        "contract_title",
-        "description",
-        "procurement_description",
-        "project_name",
-    ):
-        value = record.get(key)
-        if isinstance(value, str):
-            parts.append(value)
-
-    return " \n".join(parts)
+    parts = (_str(record.get(key)) for key in AWARD_TEXT_KEYS)
+    return " \n".join(part for part in parts if part)
 
 
 def award_matches_keywords(record: Dict[str, Any]) -> bool:
-    """Return True if any GIS keyword is found in the award text."""
+    """Return True if any GIS keyword is found in the award text.
+
+    Fields are scanned one at a time and the first hit wins, so the
+    joined text blob is never allocated on the matching path.
+    """
 
-    return text_matches_keywords(extract_award_text(record), KEYWORDS)
+    return any(
+        text_matches_keywords(_str(record.get(key))) for key in AWARD_TEXT_KEYS
+    )
 
 
 def get_award_id(record: Dict[str, Any]) -> str:
     """Best-effort extraction of a stable award ID."""
 
-    for key in ("contract_id", "award_id", "id"):
+    for key in AWARD_ID_KEYS:
         value = record.get(key)
         if value is not None:
             return str(value)
@@ -1135,25 +1462,15 @@ def get_award_id(record: Dict[str, Any]) -> str:
 def get_award_last_update(record: Dict[str, Any]) -> str:
     """Return a last-update marker for an award record."""
 
-    for key in (
-        "updated_date",
-        "last_update_date",
-        "award_date",
-        "contract_sign_date",
-    ):
-        value = record.get(key)
-        if isinstance(value, str):
-            return value
-    return ""
+    return _first_str(record, AWARD_UPDATE_KEYS)
 
 
 def get_award_url(record: Dict[str, Any]) -> str:
     """Return a URL for the award if present, or a generic fallback."""
 
-    for key in ("url", "contract_url", "link"):
-        value = record.get(key)
-        if isinstance(value, str) and value:
-            return value
+    url = _first_str(record, AWARD_URL_KEYS)
+    if url:
+        return url
 
     # Generic contract awards info page as fallback.
     return (
@@ -1165,12 +1482,7 @@ def get_award_url(record: Dict[str, Any]) -> str:
 def format_award_amount(record: Dict[str, Any]) -> str:
     """Return a readable award amount if present."""
 
-    for key in (
-        "contract_amount_usd",
-        "contract_value_usd",
-        "contract_value",
-        "amount",
-    ):
+    for key in AWARD_AMOUNT_KEYS:
         value = record.get(key)
         if isinstance(value, (int, float)):
             return f"${value:,.2f}"
@@ -1182,19 +1494,11 @@ def format_award_amount(record: Dict[str, Any]) -> str:
 def get_award_supplier_name(record: Dict[str, Any]) -> str:
     """Return the supplier / contractor name if present."""
 
-    for key in ("supplier_name", "supplier", "contractor_name", "vendor_name"):
-        value = record.get(key)
-        if isinstance(value, str) and value:
-            return value
-    return "(Unknown supplier)"
+    return _first_str(record, AWARD_SUPPLIER_KEYS) or "(Unknown supplier)"
 
 
-def send_award_alert_embed(record: Dict[str, Any]) -> bool:
-    """Send a Discord embed for a new GIS-related contract award."""
-
-    if not DISCORD_WEBHOOK_URL or "REPLACE_ME" in DISCORD_WEBHOOK_URL:
-        LOGGER.warning("Webhook URL not configured; skipping award alert.")
-        return False
+def _build_award_embed(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a Discord embed for a new GIS-related contract award."""
 
     award_id = get_award_id(record) or "(unknown)"
 
@@ -1216,10 +1520,10 @@ def send_award_alert_embed(record: Dict[str, Any]) -> bool:
 
     url = get_award_url(record)
 
-    embed = {
+    return {
+        **_AWARD_EMBED_TEMPLATE,
         "title": f"Competitor Alert: {supplier}",
         "url": url,
-        "color": 0xC0392B,  # red
         "fields": [
             {"name": "Contract ID", "value": award_id, "inline": True},
             {"name": "Supplier", "value": supplier, "inline": True},
@@ -1236,42 +1540,36 @@ def send_award_alert_embed(record: Dict[str, Any]) -> bool:
                 "inline": False,
             },
         ],
-        "footer": {
-            "text": "World Bank GIS Monitor (Awards, Nigeria)",
-        },
-    }
-
-    payload = {
-        "username": "World Bank GIS Monitor",
-        "embeds": [embed],
     }
 
-    response = post_with_retries(
-        DISCORD_WEBHOOK_URL,
-        payload=payload,
-        headers={"User-Agent": "WB-GIS-Monitor-Agent/1.0"},
-    )
-    if response is None:
-        LOGGER.error("Award alert webhook failed after retries.")
-        return False
-
-    if 200 <= response.status_code < 300:
-        LOGGER.info("Sent award alert for %s.", award_id)
-        return True
-
-    LOGGER.error(
-        "Award alert webhook returned %s: %s",
-        response.status_code,
-        response.text,
-    )
-    return False
-
 
 # ---------------------------------------------------------------------------
 # Heartbeat / health check
 # ---------------------------------------------------------------------------
 
 
+# Static heartbeat scaffolding; only the eight counter values change
+# between sends.
+_HEARTBEAT_EMBED_TEMPLATE = {
+    "title": "World Bank GIS Monitor Heartbeat",
+    "description": "System healthy: daily scan for GIS opportunities in Nigeria.",
+    "color": 0x3498DB,  # blue
+    "footer": {
+        "text": "Heartbeat status from World Bank GIS Monitor (Nigeria)",
+    },
+}
+_HEARTBEAT_FIELD_NAMES = (
+    "Projects scanned",
+    "Procurement plans scanned",
+    "Tenders scanned",
+    "Awards scanned",
+    "Project alerts this run",
+    "Procurement plan alerts this run",
+    "Tender alerts this run",
+    "Award alerts this run",
+)
+
+
 def send_discord_heartbeat(
     total_projects: int,
     total_docs: int,
@@ -1284,87 +1582,26 @@ def send_discord_heartbeat(
 ) -> bool:
     """Send a periodic heartbeat message so we know the monitor is alive."""
 
-    if not DISCORD_WEBHOOK_URL or "REPLACE_ME" in DISCORD_WEBHOOK_URL:
-        LOGGER.warning("Webhook URL not configured; skipping heartbeat.")
-        return False
-
-    description = "System healthy: daily scan for GIS opportunities in Nigeria."
+    counts = (
+        total_projects,
+        total_docs,
+        total_tenders,
+        total_awards,
+        project_alerts,
+        document_alerts,
+        tender_alerts,
+        award_alerts,
+    )
 
     embed = {
-        "title": "World Bank GIS Monitor Heartbeat",
-        "description": description,
-        "color": 0x3498DB,  # blue
+        **_HEARTBEAT_EMBED_TEMPLATE,
         "fields": [
-            {
-                "name": "Projects scanned",
-                "value": str(total_projects),
-                "inline": True,
-            },
-            {
-                "name": "Procurement plans scanned",
-                "value": str(total_docs),
-                "inline": True,
-            },
-            {
-                "name": "Tenders scanned",
-                "value": str(total_tenders),
-                "inline": True,
-            },
-            {
-                "name": "Awards scanned",
-                "value": str(total_awards),
-                "inline": True,
-            },
-            {
-                "name": "Project alerts this run",
-                "value": str(project_alerts),
-                "inline": True,
-            },
-            {
-                "name": "Procurement plan alerts this run",
-                "value": str(document_alerts),
-                "inline": True,
-            },
-            {
-                "name": "Tender alerts this run",
-                "value": str(tender_alerts),
-                "inline": True,
-            },
-            {
-                "name": "Award alerts this run",
-                "value": str(award_alerts),
-                "inline": True,
-            },
+            {"name": name, "value": str(value), "inline": True}
+            for name, value in zip(_HEARTBEAT_FIELD_NAMES, counts)
         ],
-        "footer": {
-            "text": "Heartbeat status from World Bank GIS Monitor (Nigeria)",
-        },
-    }
-
-    payload = {
-        "username": "World Bank GIS Monitor",
-        "embeds": [embed],
     }
 
-    response = post_with_retries(
-        DISCORD_WEBHOOK_URL,
-        payload=payload,
-        headers={"User-Agent": "WB-GIS-Monitor-Agent/1.0"},
-    )
-    if response is None:
-        LOGGER.error("Heartbeat webhook failed after retries.")
-        return False
-
-    if 200 <= response.status_code < 300:
-        LOGGER.info("Sent heartbeat message.")
-        return True
-
-    LOGGER.error(
-        "Heartbeat webhook returned %s: %s",
-        response.status_code,
-        response.text,
-    )
-    return False
+    return send_embeds_batch([embed], "heartbeat")
 
 
 # ---------------------------------------------------------------------------
@@ -1377,9 +1614,15 @@ def run_monitor() -> None:
 
     LOGGER.info("Loading state files...")
     projects_state = _load_state_map(PROJECTS_STATE_FILE)
-    tenders_state = _load_state_map(TENDERS_STATE_FILE)
-    awards_state = _load_state_map(AWARDS_STATE_FILE)
-    monitor_state = load_monitor_state()
+    docs_state = _load_state_map(DOCS_STATE_FILE)
+    # Disabled streams never touch their state, so skip the disk read
+    # and parse entirely; the heartbeat state is loaded lazily below.
+    tenders_state = (
+        _load_state_map(TENDERS_STATE_FILE) if ENABLE_TENDERS_STREAM else {}
+    )
+    awards_state = (
+        _load_state_map(AWARDS_STATE_FILE) if ENABLE_AWARDS_STREAM else {}
+    )
 
     LOGGER.info(
         "Loaded state: %d projects, %d tenders, %d awards.",
@@ -1388,6 +1631,11 @@ def run_monitor() -> None:
         len(awards_state),
     )
 
+    if not WEBHOOK_ENABLED:
+        LOGGER.warning(
+            "Webhook URL not configured; scanning only, no alerts will be sent."
+        )
+
     total_projects = 0
     total_docs = 0
     total_tenders = 0
@@ -1397,219 +1645,145 @@ def run_monitor() -> None:
     tender_alerts = 0
     award_alerts = 0
 
-    # -------------------------
-    # Stream 1: Projects
-    # -------------------------
-
-    LOGGER.info("Fetching active projects for Nigeria...")
-    projects = fetch_projects_for_nigeria()
-    total_projects = len(projects)
-    LOGGER.info("Projects: %d records.", total_projects)
-
-    matching_projects: List[Dict[str, Any]] = [
-        p for p in projects if project_matches_keywords(p)
-    ]
-    LOGGER.info("Projects: %d GIS-related projects.", len(matching_projects))
-
-    for project in matching_projects:
-        project_id = str(project.get("id") or "").strip()
-        if not project_id:
-            continue
-
-        current_update = get_project_last_update(project)
-        previous_update = projects_state.get(project_id)
-
-        if previous_update is not None and previous_update == current_update:
-            continue
-
-        is_update = previous_update is not None and previous_update != current_update
-        if is_update:
-            LOGGER.info(
-                "Project %s updated (was %s, now %s).",
-                project_id,
-                previous_update,
-                current_update,
+    # All stream state is persisted in one pass in the finally block
+    # below, so alerts delivered before a crash in a later stream are
+    # never re-sent on the next run.
+    try:
+        # Kick every enabled fetch off together -- the helpers release
+        # the GIL during network waits, so the fetch phase costs the
+        # slowest stream rather than the sum of all of them.
+        LOGGER.info("Fetching all enabled streams concurrently...")
+        with ThreadPoolExecutor(max_workers=4) as fetch_pool:
+            projects_future = fetch_pool.submit(fetch_projects_for_nigeria)
+            docs_future = fetch_pool.submit(fetch_procurement_plans_for_nigeria)
+            tenders_future = (
+                fetch_pool.submit(fetch_tenders_for_nigeria)
+                if ENABLE_TENDERS_STREAM
+                else None
             )
-        else:
-            LOGGER.info("New project %s detected.", project_id)
-
-        sent = send_project_alert_embed(project, is_update=is_update)
-        if sent:
-            projects_state[project_id] = current_update
-            project_alerts += 1
-
-    _save_state_map(PROJECTS_STATE_FILE, projects_state)
-    LOGGER.info(
-        "Saved %d project entries to %s.",
-        len(projects_state),
-        PROJECTS_STATE_FILE,
-    )
-
-    # -------------------------
-    # Stream 2: Procurement Plan Documents (WDS)
-    # -------------------------
-    LOGGER.info("Fetching procurement plan documents for Nigeria (WDS)...")
-    docs = fetch_procurement_plans_for_nigeria()
-    total_docs = len(docs)
-    LOGGER.info("Procurement plans: %d records.", total_docs)
-
-    matching_docs: List[Dict[str, Any]] = [
-        d for d in docs if document_matches_keywords(d)
-    ]
-    LOGGER.info(
-        "Procurement plans: %d GIS-related documents.",
-        len(matching_docs),
-    )
-
-    docs_state = _load_state_map(DOCS_STATE_FILE)
-
-    for doc in matching_docs:
-        doc_id = get_document_id(doc)
-        if not doc_id:
-            continue
-
-        current_update = get_document_last_update(doc)
-        previous_update = docs_state.get(doc_id)
-
-        if previous_update is not None and previous_update == current_update:
-            continue
-
-        is_update = previous_update is not None and previous_update != current_update
-        LOGGER.info(
-            "New/updated procurement plan %s detected (was %s, now %s).",
-            doc_id,
-            previous_update,
-            current_update,
-        )
-
-        sent = send_procurement_plan_alert_embed(doc, is_update=is_update)
-        if sent:
-            docs_state[doc_id] = current_update
-            document_alerts += 1
-
-    _save_state_map(DOCS_STATE_FILE, docs_state)
-    LOGGER.info(
-        "Saved %d procurement plan entries to %s.",
-        len(docs_state),
-        DOCS_STATE_FILE,
-    )
-
-    # -------------------------
-    # Stream 3: Tenders / Notices (Finances One)
-    # -------------------------
-
-    if ENABLE_TENDERS_STREAM:
-        LOGGER.info("Fetching procurement notices / tenders for Nigeria...")
-        tenders = fetch_tenders_for_nigeria()
-        total_tenders = len(tenders)
-        LOGGER.info("Tenders: %d records.", total_tenders)
-
-        matching_tenders: List[Dict[str, Any]] = [
-            t for t in tenders if tender_matches_keywords(t)
-        ]
-        LOGGER.info("Tenders: %d GIS-related notices.", len(matching_tenders))
-
-        for tender in matching_tenders:
-            tender_id = get_tender_id(tender)
-            if not tender_id:
-                continue
-
-            current_update = get_tender_last_update(tender)
-            previous_update = tenders_state.get(tender_id)
-
-            if previous_update is not None and previous_update == current_update:
-                continue
-
-            LOGGER.info(
-                "New/updated tender %s detected (was %s, now %s).",
-                tender_id,
-                previous_update,
-                current_update,
+            awards_future = (
+                fetch_pool.submit(fetch_awards_for_nigeria)
+                if ENABLE_AWARDS_STREAM
+                else None
             )
 
-            sent = send_tender_alert_embed(tender)
-            if sent:
-                tenders_state[tender_id] = current_update
-                tender_alerts += 1
-
-        _save_state_map(TENDERS_STATE_FILE, tenders_state)
-        LOGGER.info(
-            "Saved %d tender entries to %s.",
-            len(tenders_state),
-            TENDERS_STATE_FILE,
+            projects = projects_future.result()
+            docs = docs_future.result()
+            tenders = tenders_future.result() if tenders_future else []
+            awards = awards_future.result() if awards_future else []
+
+        # -------------------------
+        # Stream 1: Projects
+        # -------------------------
+
+        total_projects = len(projects)
+        LOGGER.info("Projects: %d records.", total_projects)
+        project_alerts = _run_stream(
+            "project",
+            projects,
+            project_matches_keywords,
+            _get_project_id,
+            get_project_last_update,
+            _build_project_embed,
+            projects_state,
         )
-    else:
-        LOGGER.info("Tenders stream is disabled; skipping Finances One tenders.")
 
-    # -------------------------
-    # Stream 4: Contract Awards (Finances One)
-    # -------------------------
+        # -------------------------
+        # Stream 2: Procurement Plan Documents (WDS)
+        # -------------------------
+
+        total_docs = len(docs)
+        LOGGER.info("Procurement plans: %d records.", total_docs)
+        document_alerts = _run_stream(
+            "procurement plan",
+            docs,
+            document_matches_keywords,
+            get_document_id,
+            get_document_last_update,
+            _build_procurement_plan_embed,
+            docs_state,
+        )
 
-    if ENABLE_AWARDS_STREAM:
-        LOGGER.info("Fetching contract awards for Nigeria...")
-        awards = fetch_awards_for_nigeria()
-        total_awards = len(awards)
-        LOGGER.info("Awards: %d records.", total_awards)
-
-        matching_awards: List[Dict[str, Any]] = [
-            a for a in awards if award_matches_keywords(a)
-        ]
-        LOGGER.info("Awards: %d GIS-related contract awards.", len(matching_awards))
-
-        for award in matching_awards:
-            award_id = get_award_id(award)
-            if not award_id:
-                continue
-
-            current_update = get_award_last_update(award)
-            previous_update = awards_state.get(award_id)
-
-            if previous_update is not None and previous_update == current_update:
-                continue
-
-            LOGGER.info(
-                "New/updated award %s detected (was %s, now %s).",
-                award_id,
-                previous_update,
-                current_update,
+        # -------------------------
+        # Stream 3: Tenders / Notices (Finances One)
+        # -------------------------
+
+        if ENABLE_TENDERS_STREAM:
+            total_tenders = len(tenders)
+            LOGGER.info("Tenders: %d records.", total_tenders)
+            tender_alerts = _run_stream(
+                "tender",
+                tenders,
+                tender_matches_keywords,
+                get_tender_id,
+                get_tender_last_update,
+                lambda record, _is_update: _build_tender_embed(record),
+                tenders_state,
             )
-
-            sent = send_award_alert_embed(award)
-            if sent:
-                awards_state[award_id] = current_update
-                award_alerts += 1
-
-        _save_state_map(AWARDS_STATE_FILE, awards_state)
-        LOGGER.info(
-            "Saved %d award entries to %s.",
-            len(awards_state),
-            AWARDS_STATE_FILE,
-        )
-    else:
-        LOGGER.info("Awards stream is disabled; skipping Finances One awards.")
+        else:
+            LOGGER.info("Tenders stream is disabled; skipping Finances One tenders.")
+
+        # -------------------------
+        # Stream 4: Contract Awards (Finances One)
+        # -------------------------
+
+        if ENABLE_AWARDS_STREAM:
+            total_awards = len(awards)
+            LOGGER.info("Awards: %d records.", total_awards)
+            award_alerts = _run_stream(
+                "award",
+                awards,
+                award_matches_keywords,
+                get_award_id,
+                get_award_last_update,
+                lambda record, _is_update: _build_award_embed(record),
+                awards_state,
+            )
+        else:
+            LOGGER.info("Awards stream is disabled; skipping Finances One awards.")
+
+    finally:
+        for label, path, state_map in (
+            ("project", PROJECTS_STATE_FILE, projects_state),
+            ("procurement plan", DOCS_STATE_FILE, docs_state),
+            ("tender", TENDERS_STATE_FILE, tenders_state),
+            ("award", AWARDS_STATE_FILE, awards_state),
+        ):
+            written = _save_state_map(path, state_map)
+            if written:
+                LOGGER.info(
+                    "Saved %d %s entries to %s.",
+                    written,
+                    label,
+                    _state_log_path(path),
+                )
 
     # -------------------------
     # Weekly heartbeat (dead-man's switch)
     # -------------------------
 
-    today = date.today().isoformat()
-    last_heartbeat = monitor_state.get("last_heartbeat_date", "")
-
-    # Monday (weekday=0) is the default heartbeat day; adjust if you prefer.
-    if date.today().weekday() == 0 and last_heartbeat != today:
-        sent = send_discord_heartbeat(
-            total_projects=total_projects,
-            total_docs=total_docs,
-            total_tenders=total_tenders,
-            total_awards=total_awards,
-            project_alerts=project_alerts,
-            document_alerts=document_alerts,
-            tender_alerts=tender_alerts,
-            award_alerts=award_alerts,
-        )
-        if sent:
-            monitor_state["last_heartbeat_date"] = today
-            save_monitor_state(monitor_state)
+    # Monday (weekday=0) is the default heartbeat day; adjust if you
+    # prefer. The monitor state is only loaded on heartbeat days, and
+    # the date is taken once so the whole block agrees on it even across
+    # a midnight boundary.
+    today = date.today()
+    today_iso = today.isoformat()
+    if today.weekday() == 0:
+        monitor_state = load_monitor_state()
+        if monitor_state.get("last_heartbeat_date", "") != today_iso:
+            sent = send_discord_heartbeat(
+                total_projects=total_projects,
+                total_docs=total_docs,
+                total_tenders=total_tenders,
+                total_awards=total_awards,
+                project_alerts=project_alerts,
+                document_alerts=document_alerts,
+                tender_alerts=tender_alerts,
+                award_alerts=award_alerts,
+            )
+            if sent:
+                monitor_state["last_heartbeat_date"] = today_iso
+                save_monitor_state(monitor_state)
 
     LOGGER.info(
         "Run complete. Alerts this run -> projects: %d, tenders: %d, awards: %d.",